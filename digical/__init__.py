@@ -1,4 +1,4 @@
 # flake8: noqa
-from .lib import Time, TimeRange, Schedule
+from .lib import Time, TimeRange, Schedule, FrozenSchedule, ArraySchedule, NumpySchedule, RecurringSchedule, BitmapSchedule, ChunkedSchedule, CountingSchedule, ScheduleIndex
 
 __version__ = "1.0.0"
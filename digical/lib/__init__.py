@@ -2,3 +2,11 @@
 from .time import Time
 from .timerange import TimeRange
 from .schedule import Schedule
+from .frozenschedule import FrozenSchedule
+from .arrayschedule import ArraySchedule
+from .numpyschedule import NumpySchedule
+from .recurringschedule import RecurringSchedule
+from .bitmapschedule import BitmapSchedule
+from .chunkedschedule import ChunkedSchedule
+from .countingschedule import CountingSchedule
+from .scheduleindex import ScheduleIndex
@@ -0,0 +1,351 @@
+from __future__ import annotations
+from array import array
+from itertools import cycle
+from typing import Callable, Iterable, Sequence, Union
+import bisect
+import heapq
+
+from .timerange import Time, TimeRange
+from .schedule import Schedule
+
+
+class ArraySchedule:
+    """
+    A Schedule that stores its boundaries as a flat array of integers
+    (start0, end0, start1, end1, ...) and only builds TimeRange objects
+    when they are asked for.
+    """
+    __slots__ = ("_bounds", )
+
+    def __init__(self, timeranges=()):
+        """ArraySchedule() -> ArraySchedule"""
+        self._bounds = _coalesce(timeranges)
+
+    @classmethod
+    def from_ranges(cls, timeranges: Iterable[TimeRange], normalized: bool = False) -> ArraySchedule:
+        """
+        ArraySchedule.from_ranges(*TimeRange) -> ArraySchedule
+        ArraySchedule.from_ranges(*TimeRange, normalized=True) -> ArraySchedule
+        """
+        if not normalized:
+            return cls(timeranges)
+        bounds = array("q")
+        for r in timeranges:
+            bounds.append(r.start.value)
+            bounds.append(r.end.value)
+        return cls._from_bounds(bounds)
+
+    @classmethod
+    def from_schedule(cls, schedule: Schedule) -> ArraySchedule:
+        """ArraySchedule.from_schedule(Schedule) -> ArraySchedule"""
+        return cls.from_ranges(schedule.timeranges, normalized=True)
+
+    @classmethod
+    def from_json(cls, j):
+        """ArraySchedule.from_json(dict) -> ArraySchedule"""
+        timeranges = [TimeRange.from_json(r) for r in j["timeranges"]]
+        return cls(timeranges)
+
+    @classmethod
+    def _from_bounds(cls, bounds: array) -> ArraySchedule:
+        schedule = cls.__new__(cls)
+        schedule._bounds = bounds
+        return schedule
+
+    def to_json(self):
+        """ArraySchedule.to_json() -> dict"""
+        return {
+            "timeranges": [TimeRange.to_json(r) for r in self.timeranges]
+        }
+
+    def to_schedule(self) -> Schedule:
+        """ArraySchedule.to_schedule() -> Schedule"""
+        return Schedule.from_ranges(self.timeranges, normalized=True)
+
+    def copy(self) -> ArraySchedule:
+        """ArraySchedule.copy() -> ArraySchedule"""
+        return self._from_bounds(array("q", self._bounds))
+
+    def __repr__(self) -> str:
+        """repr(ArraySchedule) -> repr"""
+        return f"ArraySchedule({list(self.timeranges)!r})"
+
+    def __str__(self) -> str:
+        """str(ArraySchedule) -> str"""
+        return "; ".join(str(r) for r in self.timeranges)
+
+    def __len__(self):
+        """len(ArraySchedule) -> int"""
+        return sum(self._bounds[1::2]) - sum(self._bounds[::2])
+
+    @property
+    def timeranges(self):
+        """ArraySchedule.timeranges -> *TimeRange"""
+        bounds = self._bounds
+        return tuple(
+            TimeRange(Time(bounds[i]), Time(bounds[i + 1]))
+            for i in range(0, len(bounds), 2)
+        )
+
+    def __eq__(self, other: ArraySchedule) -> bool:
+        """ArraySchedule == ArraySchedule -> bool"""
+        if isinstance(other, ArraySchedule):
+            return self._bounds == other._bounds
+        else:
+            return NotImplemented
+
+    def __add__(self, other: Union[int, ArraySchedule]) -> ArraySchedule:
+        """ArraySchedule + int -> ArraySchedule"""
+        if isinstance(other, int):
+            return self._from_bounds(array("q", (b + other for b in self._bounds)))
+        if isinstance(other, ArraySchedule):
+            return self.union(other)
+        else:
+            return NotImplemented
+
+    def __sub__(self, other: Union[int, ArraySchedule]) -> ArraySchedule:
+        """ArraySchedule - int -> ArraySchedule"""
+        if isinstance(other, int):
+            return self._from_bounds(array("q", (b - other for b in self._bounds)))
+        if isinstance(other, ArraySchedule):
+            return self.difference(other)
+        else:
+            return NotImplemented
+
+    def __radd__(self, other: int) -> ArraySchedule:
+        """int + ArraySchedule -> ArraySchedule"""
+        if isinstance(other, int):
+            return self.__add__(other)
+        else:
+            return NotImplemented
+
+    def __iadd__(self, other: Union[int, ArraySchedule]) -> ArraySchedule:
+        """ArraySchedule += int -> None"""
+        if isinstance(other, int):
+            self._bounds = array("q", (b + other for b in self._bounds))
+            return self
+        if isinstance(other, ArraySchedule):
+            self.update(other)
+            return self
+        else:
+            return NotImplemented
+
+    def __isub__(self, other: Union[int, ArraySchedule]) -> ArraySchedule:
+        """ArraySchedule -= int -> None"""
+        if isinstance(other, int):
+            self._bounds = array("q", (b - other for b in self._bounds))
+            return self
+        if isinstance(other, ArraySchedule):
+            self.difference_update(other)
+            return self
+        else:
+            return NotImplemented
+
+    def __contains__(self, other: Union[Time, TimeRange]) -> bool:
+        """Time in ArraySchedule -> bool"""
+        """TimeRange in ArraySchedule -> bool"""
+        if isinstance(other, Time):
+            return bisect.bisect_right(self._bounds, other.value) % 2 == 1
+        if isinstance(other, TimeRange):
+            i = bisect.bisect_right(self._bounds, other.start.value)
+            return i % 2 == 1 and other.end.value <= self._bounds[i]
+        else:
+            return NotImplemented
+
+    def add(self, timerange: TimeRange) -> None:
+        start = timerange.start.value
+        end = timerange.end.value
+        # An odd index means the boundary falls inside (or touches) a stored
+        # range, which then absorbs it
+        i = bisect.bisect_left(self._bounds, start)
+        j = bisect.bisect_right(self._bounds, end, i)
+        bounds = array("q")
+        if i % 2 == 0:
+            bounds.append(start)
+        if j % 2 == 0:
+            bounds.append(end)
+        self._bounds[i:j] = bounds
+
+    def remove(self, timerange: TimeRange) -> None:
+        if timerange not in self:
+            raise KeyError
+        self.discard(timerange)
+
+    def discard(self, timerange: TimeRange) -> None:
+        start = timerange.start.value
+        end = timerange.end.value
+        i = bisect.bisect_left(self._bounds, start)
+        j = bisect.bisect_right(self._bounds, end, i)
+        bounds = array("q")
+        if i % 2 == 1:
+            bounds.append(start)
+        if j % 2 == 1:
+            bounds.append(end)
+        self._bounds[i:j] = bounds
+
+    def pop(self) -> TimeRange:
+        if not self._bounds:
+            raise KeyError
+        end = self._bounds.pop()
+        start = self._bounds.pop()
+        return TimeRange(Time(start), Time(end))
+
+    def isdisjoint(self, other: ArraySchedule) -> bool:
+        return not _merge(self._bounds, other._bounds, _and)
+
+    def issubset(self, other: ArraySchedule) -> bool:
+        return not _merge(other._bounds, self._bounds, _sub)
+
+    def __le__(self, other: ArraySchedule) -> bool:
+        return other.issubset(self)
+
+    def __lt__(self, other: ArraySchedule) -> bool:
+        if self == other:
+            return False
+        return other.issubset(self)
+
+    def issuperset(self, other: ArraySchedule) -> bool:
+        return other.issubset(self)
+
+    def __ge__(self, other: ArraySchedule) -> bool:
+        return other.issuperset(self)
+
+    def __gt__(self, other: ArraySchedule) -> bool:
+        if self == other:
+            return False
+        return other.issuperset(self)
+
+    def union(self, *others: ArraySchedule) -> ArraySchedule:
+        schedule = self.copy()
+        schedule.update(*others)
+        return schedule
+
+    def __or__(self, other: ArraySchedule) -> ArraySchedule:
+        return self.union(other)
+
+    def intersection(self, *others: ArraySchedule) -> ArraySchedule:
+        schedule = self.copy()
+        schedule.intersection_update(*others)
+        return schedule
+
+    def __and__(self, other: ArraySchedule) -> ArraySchedule:
+        return self.intersection(other)
+
+    def difference(self, *others: ArraySchedule) -> ArraySchedule:
+        schedule = self.copy()
+        schedule.difference_update(*others)
+        return schedule
+
+    def sub(self, other: ArraySchedule) -> ArraySchedule:
+        return self.difference(other)
+
+    def symmetric_difference(self, other: ArraySchedule) -> ArraySchedule:
+        return self._from_bounds(_merge(self._bounds, other._bounds, _xor))
+
+    def __xor__(self, other: ArraySchedule) -> ArraySchedule:
+        return self.symmetric_difference(other)
+
+    def update(self, *others: ArraySchedule) -> None:
+        if len(others) == 1:
+            self._bounds = _merge(self._bounds, others[0]._bounds, _or)
+        elif others:
+            bounds_lists = [self._bounds] + [o._bounds for o in others]
+            self._bounds = _sweep(bounds_lists, 1)
+
+    def __ior__(self, other: ArraySchedule) -> ArraySchedule:
+        self.update(other)
+        return self
+
+    def intersection_update(self, *others: ArraySchedule) -> None:
+        if len(others) == 1:
+            self._bounds = _merge(self._bounds, others[0]._bounds, _and)
+        elif others:
+            bounds_lists = [self._bounds] + [o._bounds for o in others]
+            self._bounds = _sweep(bounds_lists, len(bounds_lists))
+
+    def __iand__(self, other: ArraySchedule) -> ArraySchedule:
+        self.intersection_update(other)
+        return self
+
+    def difference_update(self, *others: ArraySchedule) -> None:
+        if len(others) == 1:
+            self._bounds = _merge(self._bounds, others[0]._bounds, _sub)
+        elif others:
+            subtracted = _sweep([o._bounds for o in others], 1)
+            self._bounds = _merge(self._bounds, subtracted, _sub)
+
+    def symmetric_difference_update(self, other: ArraySchedule) -> ArraySchedule:
+        self._bounds = _merge(self._bounds, other._bounds, _xor)
+        return self
+
+    def __ixor__(self, other: ArraySchedule) -> ArraySchedule:
+        return self.symmetric_difference_update(other)
+
+
+def _or(inside_a: bool, inside_b: bool) -> bool:
+    return inside_a or inside_b
+
+
+def _and(inside_a: bool, inside_b: bool) -> bool:
+    return inside_a and inside_b
+
+
+def _sub(inside_a: bool, inside_b: bool) -> bool:
+    return inside_a and not inside_b
+
+
+def _xor(inside_a: bool, inside_b: bool) -> bool:
+    return inside_a != inside_b
+
+
+def _coalesce(timeranges: Iterable[TimeRange]) -> array:
+    """Sort ranges and merge any that overlap or touch into a boundary array"""
+    bounds = array("q")
+    for start, end in sorted((r.start.value, r.end.value) for r in timeranges):
+        if bounds and start <= bounds[-1]:
+            if end > bounds[-1]:
+                bounds[-1] = end
+        else:
+            bounds.append(start)
+            bounds.append(end)
+    return bounds
+
+
+def _merge(bounds_a: Sequence[int], bounds_b: Sequence[int], op: Callable[[bool, bool], bool]) -> array:
+    """Combine two boundary arrays with a boolean operation on their coverage"""
+    bounds = array("q")
+    inside = False
+    i = j = 0
+    len_a = len(bounds_a)
+    len_b = len(bounds_b)
+    while i < len_a or j < len_b:
+        if j == len_b or (i < len_a and bounds_a[i] <= bounds_b[j]):
+            time = bounds_a[i]
+        else:
+            time = bounds_b[j]
+        if i < len_a and bounds_a[i] == time:
+            i += 1
+        if j < len_b and bounds_b[j] == time:
+            j += 1
+        if op(i % 2 == 1, j % 2 == 1) != inside:
+            inside = not inside
+            bounds.append(time)
+    return bounds
+
+
+def _sweep(bounds_lists: Sequence[Sequence[int]], minimum: int) -> array:
+    """Boundaries of the time covered by at least `minimum` of the boundary arrays"""
+    bounds = array("q")
+    covered = False
+    count = 0
+    previous = None
+    for time, delta in heapq.merge(*(zip(b, cycle((1, -1))) for b in bounds_lists)):
+        if time != previous:
+            if (count >= minimum) != covered:
+                covered = not covered
+                bounds.append(previous)
+            previous = time
+        count += delta
+    if covered:
+        bounds.append(previous)
+    return bounds
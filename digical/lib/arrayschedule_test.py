@@ -0,0 +1,257 @@
+import pytest
+
+from digical import Time, TimeRange, Schedule, ArraySchedule
+
+
+def test_init():
+    """ArraySchedule() -> ArraySchedule"""
+    schedule_empty = ArraySchedule()
+    assert schedule_empty is not None
+    schedule = ArraySchedule([
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(1500), Time(2500))
+    ])
+    assert schedule.timeranges == (
+        TimeRange(Time(1000), Time(3000)),
+    )
+
+
+def test_from_schedule():
+    """ArraySchedule.from_schedule(Schedule) -> ArraySchedule"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    array_schedule = ArraySchedule.from_schedule(schedule)
+    assert array_schedule.timeranges == schedule.timeranges
+    assert array_schedule.to_schedule() == schedule
+
+
+def test_json():
+    """ArraySchedule.from_json(dict) -> ArraySchedule"""
+    """ArraySchedule.to_json() -> dict"""
+    schedule_json = {
+        "timeranges": [
+            {
+                "start": {"value": 1000},
+                "end": {"value": 2000}
+            },
+            {
+                "start": {"value": 2500},
+                "end": {"value": 3000}
+            }
+        ]
+    }
+    schedule = ArraySchedule.from_json(schedule_json)
+    assert schedule == ArraySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert schedule.to_json() == schedule_json
+
+
+def test_copy():
+    """ArraySchedule.copy() -> ArraySchedule"""
+    schedule_a = ArraySchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    schedule_b = schedule_a.copy()
+    assert schedule_a == schedule_b
+    schedule_b.add(TimeRange(Time(2500), Time(3000)))
+    assert schedule_a != schedule_b
+
+
+def test_len():
+    """len(ArraySchedule) -> int"""
+    schedule = ArraySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert len(schedule) == 1500
+    assert len(ArraySchedule()) == 0
+
+
+def test_add_int():
+    """ArraySchedule + int -> ArraySchedule"""
+    schedule = ArraySchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    assert schedule + 500 == ArraySchedule([
+        TimeRange(Time(1500), Time(2500))
+    ])
+    assert schedule - 500 == ArraySchedule([
+        TimeRange(Time(500), Time(1500))
+    ])
+    schedule += 100
+    assert schedule == ArraySchedule([
+        TimeRange(Time(1100), Time(2100))
+    ])
+
+
+def test_contains():
+    """Time in ArraySchedule -> bool"""
+    """TimeRange in ArraySchedule -> bool"""
+    schedule = ArraySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert (Time(500) in schedule) is False
+    assert (Time(1000) in schedule) is True
+    assert (Time(2000) in schedule) is False
+    assert (Time(2750) in schedule) is True
+    assert (Time(3000) in schedule) is False
+    assert (TimeRange(Time(1000), Time(2000)) in schedule) is True
+    assert (TimeRange(Time(1200), Time(1800)) in schedule) is True
+    assert (TimeRange(Time(1200), Time(2800)) in schedule) is False
+    assert (TimeRange(Time(500), Time(750)) in schedule) is False
+
+
+def test_add_timerange():
+    """ArraySchedule.add(TimeRange) -> None"""
+    schedule = ArraySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule.add(TimeRange(Time(2000), Time(2500)))
+    assert schedule == ArraySchedule([
+        TimeRange(Time(1000), Time(3000))
+    ])
+    schedule.add(TimeRange(Time(500), Time(1000)))
+    schedule.add(TimeRange(Time(4000), Time(4500)))
+    schedule.add(TimeRange(Time(1200), Time(1300)))
+    assert schedule.timeranges == (
+        TimeRange(Time(500), Time(3000)),
+        TimeRange(Time(4000), Time(4500))
+    )
+
+
+def test_discard_timerange():
+    """ArraySchedule.discard(TimeRange) -> None"""
+    """ArraySchedule.remove(TimeRange) -> None"""
+    schedule = ArraySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule.discard(TimeRange(Time(1500), Time(2600)))
+    assert schedule == ArraySchedule([
+        TimeRange(Time(1000), Time(1500)),
+        TimeRange(Time(2600), Time(3000))
+    ])
+    schedule.remove(TimeRange(Time(1200), Time(1300)))
+    assert schedule == ArraySchedule([
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(1300), Time(1500)),
+        TimeRange(Time(2600), Time(3000))
+    ])
+    with pytest.raises(KeyError):
+        schedule.remove(TimeRange(Time(1100), Time(1400)))
+
+
+def test_pop():
+    """ArraySchedule.pop() -> elem"""
+    schedule = ArraySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert schedule.pop() == TimeRange(Time(2500), Time(3000))
+    assert schedule.pop() == TimeRange(Time(1000), Time(2000))
+    with pytest.raises(KeyError):
+        schedule.pop()
+
+
+def test_isdisjoint():
+    """ArraySchedule.isdisjoint(ArraySchedule) -> bool"""
+    schedule_a = ArraySchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    schedule_b = ArraySchedule([
+        TimeRange(Time(1500), Time(2500))
+    ])
+    schedule_c = ArraySchedule([
+        TimeRange(Time(2000), Time(3000))
+    ])
+    assert schedule_a.isdisjoint(schedule_b) is False
+    assert schedule_a.isdisjoint(schedule_c) is True
+
+
+def test_issubset():
+    """ArraySchedule <= ArraySchedule -> bool"""
+    """ArraySchedule < ArraySchedule -> bool"""
+    schedule_a = ArraySchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    schedule_b = ArraySchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    schedule_c = ArraySchedule([
+        TimeRange(Time(1500), Time(2000))
+    ])
+    schedule_d = ArraySchedule([
+        TimeRange(Time(1500), Time(3000))
+    ])
+    assert (schedule_b <= schedule_a) is True
+    assert (schedule_c <= schedule_a) is True
+    assert (schedule_d <= schedule_a) is False
+    assert not schedule_b < schedule_a
+    assert schedule_c < schedule_a
+    assert schedule_a > schedule_c
+
+
+def test_set_operations():
+    """ArraySchedule | & - ^ ArraySchedule -> ArraySchedule"""
+    schedule_a = ArraySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule_b = ArraySchedule([
+        TimeRange(Time(1200), Time(2200)),
+        TimeRange(Time(2700), Time(3200))
+    ])
+    schedule_c = ArraySchedule([
+        TimeRange(Time(1300), Time(6000))
+    ])
+    assert schedule_a | schedule_b == ArraySchedule([
+        TimeRange(Time(1000), Time(2200)),
+        TimeRange(Time(2500), Time(3200))
+    ])
+    assert schedule_a & schedule_b == ArraySchedule([
+        TimeRange(Time(1200), Time(2000)),
+        TimeRange(Time(2700), Time(3000))
+    ])
+    assert schedule_a - schedule_b == ArraySchedule([
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(2500), Time(2700))
+    ])
+    assert schedule_a ^ schedule_b == ArraySchedule([
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(2000), Time(2200)),
+        TimeRange(Time(2500), Time(2700)),
+        TimeRange(Time(3000), Time(3200))
+    ])
+    assert schedule_a.union(schedule_b, schedule_c) == ArraySchedule([
+        TimeRange(Time(1000), Time(6000))
+    ])
+    assert schedule_a.intersection(schedule_b, schedule_c) == ArraySchedule([
+        TimeRange(Time(1300), Time(2000)),
+        TimeRange(Time(2700), Time(3000))
+    ])
+    assert schedule_a.difference(schedule_b, schedule_c) == ArraySchedule([
+        TimeRange(Time(1000), Time(1200))
+    ])
+
+
+def test_matches_schedule():
+    """ArraySchedule behaves like Schedule"""
+    timeranges_a = [TimeRange(Time(i * 70), Time(i * 70 + 40)) for i in range(50)]
+    timeranges_b = [TimeRange(Time(i * 110), Time(i * 110 + 90)) for i in range(30)]
+    schedule_a = Schedule(timeranges_a)
+    schedule_b = Schedule(timeranges_b)
+    array_a = ArraySchedule(timeranges_a)
+    array_b = ArraySchedule(timeranges_b)
+    assert (array_a | array_b).timeranges == (schedule_a | schedule_b).timeranges
+    assert (array_a & array_b).timeranges == (schedule_a & schedule_b).timeranges
+    assert (array_a - array_b).timeranges == (schedule_a - schedule_b).timeranges
+    assert (array_a ^ array_b).timeranges == (schedule_a ^ schedule_b).timeranges
+    assert len(array_a) == len(schedule_a)
+    assert str(array_a) == str(schedule_a)
@@ -0,0 +1,264 @@
+from __future__ import annotations
+from typing import Iterator, Tuple, Union
+
+from .time import MINUTES_PER_WEEK
+from .timerange import Time, TimeRange
+from .schedule import Schedule
+
+try:
+    _popcount = int.bit_count
+except AttributeError:
+    def _popcount(bits: int) -> int:
+        return bin(bits).count("1")
+
+
+class BitmapSchedule:
+    """
+    A Schedule over a bounded horizon [0, horizon) (a week by default),
+    stored as a single integer with one bit per minute.
+    """
+    __slots__ = ("_horizon", "_bits")
+
+    def __init__(self, timeranges=(), horizon: int = MINUTES_PER_WEEK):
+        """BitmapSchedule() -> BitmapSchedule"""
+        if horizon <= 0:
+            raise ValueError("Invalid BitmapSchedule: horizon must be positive")
+        self._horizon = horizon
+        self._bits = 0
+        for r in timeranges:
+            self._bits |= self._mask(r)
+
+    @classmethod
+    def _from_bits(cls, bits: int, horizon: int) -> BitmapSchedule:
+        schedule = cls.__new__(cls)
+        schedule._horizon = horizon
+        schedule._bits = bits
+        return schedule
+
+    @classmethod
+    def from_schedule(cls, schedule: Schedule, horizon: int = MINUTES_PER_WEEK) -> BitmapSchedule:
+        """BitmapSchedule.from_schedule(Schedule) -> BitmapSchedule"""
+        return cls(schedule.timeranges, horizon)
+
+    @classmethod
+    def from_json(cls, j):
+        """BitmapSchedule.from_json(dict) -> BitmapSchedule"""
+        timeranges = [TimeRange.from_json(r) for r in j["timeranges"]]
+        return cls(timeranges, j["horizon"])
+
+    def to_json(self):
+        """BitmapSchedule.to_json() -> dict"""
+        return {
+            "horizon": self._horizon,
+            "timeranges": [TimeRange.to_json(r) for r in self.timeranges]
+        }
+
+    def to_schedule(self) -> Schedule:
+        """BitmapSchedule.to_schedule() -> Schedule"""
+        return Schedule.from_ranges(self.timeranges, normalized=True)
+
+    def copy(self) -> BitmapSchedule:
+        """BitmapSchedule.copy() -> BitmapSchedule"""
+        return self._from_bits(self._bits, self._horizon)
+
+    def __repr__(self) -> str:
+        """repr(BitmapSchedule) -> repr"""
+        return f"BitmapSchedule({list(self.timeranges)!r}, horizon={self._horizon})"
+
+    def __str__(self) -> str:
+        """str(BitmapSchedule) -> str"""
+        return "; ".join(str(r) for r in self.timeranges)
+
+    def __len__(self):
+        """len(BitmapSchedule) -> int"""
+        return _popcount(self._bits)
+
+    @property
+    def horizon(self) -> int:
+        """BitmapSchedule.horizon -> int"""
+        return self._horizon
+
+    @property
+    def bits(self) -> int:
+        """BitmapSchedule.bits -> int"""
+        return self._bits
+
+    @property
+    def timeranges(self):
+        """BitmapSchedule.timeranges -> *TimeRange"""
+        return tuple(TimeRange(Time(start), Time(end)) for start, end in _runs(self._bits))
+
+    def __eq__(self, other: BitmapSchedule) -> bool:
+        """BitmapSchedule == BitmapSchedule -> bool"""
+        if isinstance(other, BitmapSchedule):
+            return self._horizon == other._horizon and self._bits == other._bits
+        else:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __contains__(self, other: Union[Time, TimeRange]) -> bool:
+        """Time in BitmapSchedule -> bool"""
+        """TimeRange in BitmapSchedule -> bool"""
+        if isinstance(other, Time):
+            return 0 <= other.value < self._horizon and bool(self._bits >> other.value & 1)
+        if isinstance(other, TimeRange):
+            if other.start.value < 0 or other.end.value > self._horizon:
+                return False
+            mask = self._mask(other)
+            return self._bits & mask == mask
+        else:
+            return NotImplemented
+
+    def _mask(self, timerange: TimeRange) -> int:
+        start = timerange.start.value
+        end = timerange.end.value
+        if start < 0 or end > self._horizon:
+            raise ValueError(f"TimeRange outside of BitmapSchedule horizon: {timerange!r}")
+        return ((1 << (end - start)) - 1) << start
+
+    def add(self, timerange: TimeRange) -> None:
+        self._bits |= self._mask(timerange)
+
+    def remove(self, timerange: TimeRange) -> None:
+        if timerange not in self:
+            raise KeyError
+        self.discard(timerange)
+
+    def discard(self, timerange: TimeRange) -> None:
+        self._bits &= ~self._mask(timerange)
+
+    def pop(self) -> TimeRange:
+        if not self._bits:
+            raise KeyError
+        end = self._bits.bit_length()
+        start = (~self._bits & ((1 << end) - 1)).bit_length()
+        self._bits &= (1 << start) - 1
+        return TimeRange(Time(start), Time(end))
+
+    def _check(self, other: BitmapSchedule) -> None:
+        if other._horizon != self._horizon:
+            raise ValueError("BitmapSchedule horizons differ")
+
+    def isdisjoint(self, other: BitmapSchedule) -> bool:
+        self._check(other)
+        return not self._bits & other._bits
+
+    def issubset(self, other: BitmapSchedule) -> bool:
+        self._check(other)
+        return other._bits & ~self._bits == 0
+
+    def __le__(self, other: BitmapSchedule) -> bool:
+        return other.issubset(self)
+
+    def __lt__(self, other: BitmapSchedule) -> bool:
+        if self == other:
+            return False
+        return other.issubset(self)
+
+    def issuperset(self, other: BitmapSchedule) -> bool:
+        return other.issubset(self)
+
+    def __ge__(self, other: BitmapSchedule) -> bool:
+        return other.issuperset(self)
+
+    def __gt__(self, other: BitmapSchedule) -> bool:
+        if self == other:
+            return False
+        return other.issuperset(self)
+
+    def union(self, *others: BitmapSchedule) -> BitmapSchedule:
+        schedule = self.copy()
+        schedule.update(*others)
+        return schedule
+
+    def __or__(self, other: BitmapSchedule) -> BitmapSchedule:
+        if not isinstance(other, BitmapSchedule):
+            return NotImplemented
+        return self.union(other)
+
+    def intersection(self, *others: BitmapSchedule) -> BitmapSchedule:
+        schedule = self.copy()
+        schedule.intersection_update(*others)
+        return schedule
+
+    def __and__(self, other: BitmapSchedule) -> BitmapSchedule:
+        if not isinstance(other, BitmapSchedule):
+            return NotImplemented
+        return self.intersection(other)
+
+    def difference(self, *others: BitmapSchedule) -> BitmapSchedule:
+        schedule = self.copy()
+        schedule.difference_update(*others)
+        return schedule
+
+    def __sub__(self, other: BitmapSchedule) -> BitmapSchedule:
+        if not isinstance(other, BitmapSchedule):
+            return NotImplemented
+        return self.difference(other)
+
+    def sub(self, other: BitmapSchedule) -> BitmapSchedule:
+        return self.difference(other)
+
+    def symmetric_difference(self, other: BitmapSchedule) -> BitmapSchedule:
+        schedule = self.copy()
+        schedule.symmetric_difference_update(other)
+        return schedule
+
+    def __xor__(self, other: BitmapSchedule) -> BitmapSchedule:
+        if not isinstance(other, BitmapSchedule):
+            return NotImplemented
+        return self.symmetric_difference(other)
+
+    def __invert__(self) -> BitmapSchedule:
+        """~BitmapSchedule -> BitmapSchedule"""
+        return self._from_bits(~self._bits & ((1 << self._horizon) - 1), self._horizon)
+
+    def update(self, *others: BitmapSchedule) -> None:
+        for other in others:
+            self._check(other)
+            self._bits |= other._bits
+
+    def __ior__(self, other: BitmapSchedule) -> BitmapSchedule:
+        self.update(other)
+        return self
+
+    def intersection_update(self, *others: BitmapSchedule) -> None:
+        for other in others:
+            self._check(other)
+            self._bits &= other._bits
+
+    def __iand__(self, other: BitmapSchedule) -> BitmapSchedule:
+        self.intersection_update(other)
+        return self
+
+    def difference_update(self, *others: BitmapSchedule) -> None:
+        for other in others:
+            self._check(other)
+            self._bits &= ~other._bits
+
+    def __isub__(self, other: BitmapSchedule) -> BitmapSchedule:
+        self.difference_update(other)
+        return self
+
+    def symmetric_difference_update(self, other: BitmapSchedule) -> BitmapSchedule:
+        self._check(other)
+        self._bits ^= other._bits
+        return self
+
+    def __ixor__(self, other: BitmapSchedule) -> BitmapSchedule:
+        return self.symmetric_difference_update(other)
+
+
+def _runs(bits: int) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) for each run of set bits, lowest first"""
+    position = 0
+    while bits:
+        zeros = (bits & -bits).bit_length() - 1
+        bits >>= zeros
+        position += zeros
+        # x ^ (x + 1) sets exactly the trailing ones plus the bit above them
+        ones = (bits ^ (bits + 1)).bit_length() - 1
+        yield position, position + ones
+        bits >>= ones
+        position += ones
@@ -0,0 +1,128 @@
+import pytest
+
+from digical import Time, TimeRange, Schedule, BitmapSchedule
+
+
+def test_init():
+    """BitmapSchedule() -> BitmapSchedule"""
+    schedule = BitmapSchedule([
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2000), Time(2200))
+    ])
+    assert schedule.horizon == 10080
+    assert schedule.timeranges == (
+        TimeRange(Time(1000), Time(2200)),
+        TimeRange(Time(2500), Time(3000))
+    )
+    with pytest.raises(ValueError):
+        BitmapSchedule([TimeRange(Time(10000), Time(10100))])
+    with pytest.raises(ValueError):
+        BitmapSchedule(horizon=0)
+
+
+def test_from_schedule():
+    """BitmapSchedule.from_schedule(Schedule) -> BitmapSchedule"""
+    """BitmapSchedule.to_schedule() -> Schedule"""
+    schedule = Schedule([
+        TimeRange(Time(0), Time(1)),
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(10079), Time(10080))
+    ])
+    bitmap = BitmapSchedule.from_schedule(schedule)
+    assert bitmap.to_schedule() == schedule
+    assert BitmapSchedule.from_json(bitmap.to_json()) == bitmap
+
+
+def test_len():
+    """len(BitmapSchedule) -> int"""
+    schedule = BitmapSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert len(schedule) == 1500
+
+
+def test_contains():
+    """Time in BitmapSchedule -> bool"""
+    """TimeRange in BitmapSchedule -> bool"""
+    schedule = BitmapSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert (Time(500) in schedule) is False
+    assert (Time(1000) in schedule) is True
+    assert (Time(2000) in schedule) is False
+    assert (Time(-1) in schedule) is False
+    assert (Time(20000) in schedule) is False
+    assert (TimeRange(Time(1200), Time(1800)) in schedule) is True
+    assert (TimeRange(Time(1200), Time(2800)) in schedule) is False
+
+
+def test_add_discard():
+    """BitmapSchedule.add(TimeRange) -> None"""
+    """BitmapSchedule.discard(TimeRange) -> None"""
+    schedule = BitmapSchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    schedule.add(TimeRange(Time(2000), Time(2500)))
+    schedule.discard(TimeRange(Time(1200), Time(1300)))
+    assert schedule.timeranges == (
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(1300), Time(2500))
+    )
+    with pytest.raises(KeyError):
+        schedule.remove(TimeRange(Time(1100), Time(1400)))
+    assert schedule.pop() == TimeRange(Time(1300), Time(2500))
+    assert schedule.pop() == TimeRange(Time(1000), Time(1200))
+    with pytest.raises(KeyError):
+        schedule.pop()
+
+
+def test_set_operations():
+    """BitmapSchedule | & - ^ ~ BitmapSchedule -> BitmapSchedule"""
+    schedule_a = BitmapSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule_b = BitmapSchedule([
+        TimeRange(Time(1200), Time(2200)),
+        TimeRange(Time(2700), Time(3200))
+    ])
+    assert (schedule_a | schedule_b).timeranges == (
+        TimeRange(Time(1000), Time(2200)),
+        TimeRange(Time(2500), Time(3200))
+    )
+    assert (schedule_a & schedule_b).timeranges == (
+        TimeRange(Time(1200), Time(2000)),
+        TimeRange(Time(2700), Time(3000))
+    )
+    assert (schedule_a - schedule_b).timeranges == (
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(2500), Time(2700))
+    )
+    assert (schedule_a ^ schedule_b).timeranges == (
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(2000), Time(2200)),
+        TimeRange(Time(2500), Time(2700)),
+        TimeRange(Time(3000), Time(3200))
+    )
+    assert (~schedule_a).timeranges == (
+        TimeRange(Time(0), Time(1000)),
+        TimeRange(Time(2000), Time(2500)),
+        TimeRange(Time(3000), Time(10080))
+    )
+    assert schedule_a.isdisjoint(~schedule_a)
+    assert (schedule_a & schedule_b) <= schedule_a
+    with pytest.raises(ValueError):
+        schedule_a & BitmapSchedule(horizon=1440)
+
+
+def test_matches_schedule():
+    """BitmapSchedule behaves like Schedule"""
+    timeranges = [[TimeRange(Time(i * 70 + j), Time(i * 70 + j + 40)) for i in range(100)] for j in range(4)]
+    schedules = [Schedule(rs) for rs in timeranges]
+    bitmaps = [BitmapSchedule(rs) for rs in timeranges]
+    assert bitmaps[0].intersection(*bitmaps[1:]).to_schedule() == schedules[0].intersection(*schedules[1:])
+    assert bitmaps[0].union(*bitmaps[1:]).to_schedule() == schedules[0].union(*schedules[1:])
+    assert bitmaps[0].difference(*bitmaps[1:]).to_schedule() == schedules[0].difference(*schedules[1:])
@@ -0,0 +1,210 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+# Blocks are split once they hold twice this many values
+BLOCK_SIZE = 64
+
+
+class BlockTree:
+    """
+    A sequence stored as a list of short blocks, with a segment tree over
+    the blocks holding each block's length and a summary of its values.
+    Positional insert, delete and update cost one block splice plus a walk
+    up the tree, and range summaries combine O(log n) tree nodes.
+
+    Subclasses define the summary through `_summarize`, `_combine` and
+    `_identity`; `_combine` must be associative but need not commute.
+    """
+    __slots__ = ("_blocks", "_size", "_counts", "_tree")
+
+    _identity: Any = None
+
+    def __init__(self, values: Iterable = ()):
+        """BlockTree(*value) -> BlockTree"""
+        values = list(values)
+        blocks = [values[i:i + BLOCK_SIZE] for i in range(0, len(values), BLOCK_SIZE)]
+        self._rebuild(blocks or [[]])
+
+    def _summarize(self, values: List) -> Any:
+        raise NotImplementedError
+
+    def _combine(self, a: Any, b: Any) -> Any:
+        raise NotImplementedError
+
+    def _rebuild(self, blocks: List[List]) -> None:
+        size = 1
+        while size < len(blocks):
+            size *= 2
+        counts = [0] * (2 * size)
+        tree = [self._identity] * (2 * size)
+        for b, block in enumerate(blocks):
+            counts[size + b] = len(block)
+            tree[size + b] = self._summarize(block)
+        for node in range(size - 1, 0, -1):
+            counts[node] = counts[2 * node] + counts[2 * node + 1]
+            tree[node] = self._combine(tree[2 * node], tree[2 * node + 1])
+        self._blocks = blocks
+        self._size = size
+        self._counts = counts
+        self._tree = tree
+
+    def _update(self, b: int) -> None:
+        """Refresh the tree after block `b` changed in place"""
+        counts = self._counts
+        tree = self._tree
+        node = self._size + b
+        counts[node] = len(self._blocks[b])
+        tree[node] = self._summarize(self._blocks[b])
+        node //= 2
+        while node:
+            counts[node] = counts[2 * node] + counts[2 * node + 1]
+            tree[node] = self._combine(tree[2 * node], tree[2 * node + 1])
+            node //= 2
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """(block, offset) of the value at `index`; len(self) maps past the last value"""
+        if index >= self._counts[1]:
+            return len(self._blocks) - 1, index - self._counts[1] + len(self._blocks[-1])
+        counts = self._counts
+        node = 1
+        while node < self._size:
+            node *= 2
+            if index >= counts[node]:
+                index -= counts[node]
+                node += 1
+        return node - self._size, index
+
+    def _check(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return index
+
+    def __len__(self):
+        """len(BlockTree) -> int"""
+        return self._counts[1]
+
+    def __iter__(self) -> Iterator:
+        """iter(BlockTree) -> *value"""
+        for block in self._blocks:
+            yield from block
+
+    def __getitem__(self, index: int):
+        """BlockTree[int] -> value"""
+        b, offset = self._locate(self._check(index))
+        return self._blocks[b][offset]
+
+    def __setitem__(self, index: int, value) -> None:
+        """BlockTree[int] = value"""
+        b, offset = self._locate(self._check(index))
+        self._blocks[b][offset] = value
+        self._update(b)
+
+    def __delitem__(self, index: int) -> None:
+        """del BlockTree[int]"""
+        b, offset = self._locate(self._check(index))
+        block = self._blocks[b]
+        del block[offset]
+        if not block and len(self._blocks) > 1:
+            del self._blocks[b]
+            self._rebuild(self._blocks)
+        else:
+            self._update(b)
+
+    def insert(self, index: int, value) -> None:
+        """BlockTree.insert(int, value) -> None"""
+        index = min(max(index, 0), len(self))
+        b, offset = self._locate(index)
+        block = self._blocks[b]
+        block.insert(offset, value)
+        if len(block) > 2 * BLOCK_SIZE:
+            self._blocks[b:b + 1] = [block[:BLOCK_SIZE], block[BLOCK_SIZE:]]
+            self._rebuild(self._blocks)
+        else:
+            self._update(b)
+
+    def append(self, value) -> None:
+        """BlockTree.append(value) -> None"""
+        self.insert(len(self), value)
+
+    def summary(self, start: int = 0, end: int = None):
+        """BlockTree.summary(int, int) -> summary"""
+        start = max(start, 0)
+        end = len(self) if end is None else min(end, len(self))
+        if start >= end:
+            return self._identity
+        b_start, o_start = self._locate(start)
+        b_end, o_end = self._locate(end - 1)
+        if b_start == b_end:
+            return self._summarize(self._blocks[b_start][o_start:o_end + 1])
+        left = self._summarize(self._blocks[b_start][o_start:])
+        right = self._summarize(self._blocks[b_end][:o_end + 1])
+        # Whole blocks strictly between the two partial ones, kept in order
+        tree = self._tree
+        low = b_start + 1 + self._size
+        high = b_end + self._size
+        tail = self._identity
+        while low < high:
+            if low & 1:
+                left = self._combine(left, tree[low])
+                low += 1
+            if high & 1:
+                high -= 1
+                tail = self._combine(tree[high], tail)
+            low //= 2
+            high //= 2
+        return self._combine(self._combine(left, tail), right)
+
+    def find(self, start: int, predicate: Callable[[Any], bool]) -> int:
+        """
+        BlockTree.find(int, predicate) -> int
+
+        Index of the first value at or after `start` whose summary satisfies
+        `predicate`, or -1. A summary must satisfy `predicate` whenever one
+        of the values it covers does.
+        """
+        start = max(start, 0)
+        if start >= len(self):
+            return -1
+        b, offset = self._locate(start)
+        found = self._find_in_block(b, offset, predicate)
+        if found >= 0:
+            return start - offset + found
+        tree = self._tree
+        node = b + 1 + self._size
+        if node & -node == node:
+            return -1
+        while True:
+            while node % 2 == 0:
+                node //= 2
+            if predicate(tree[node]):
+                while node < self._size:
+                    node *= 2
+                    if not predicate(tree[node]):
+                        node += 1
+                b = node - self._size
+                if b >= len(self._blocks):
+                    return -1
+                return self._block_start(b) + self._find_in_block(b, 0, predicate)
+            node += 1
+            if node & -node == node:
+                return -1
+
+    def _find_in_block(self, b: int, offset: int, predicate: Callable[[Any], bool]) -> int:
+        block = self._blocks[b]
+        for k in range(offset, len(block)):
+            if predicate(self._summarize(block[k:k + 1])):
+                return k
+        return -1
+
+    def _block_start(self, b: int) -> int:
+        """Index of the first value of block `b`"""
+        counts = self._counts
+        node = self._size + b
+        index = 0
+        while node > 1:
+            if node & 1:
+                index += counts[node - 1]
+            node //= 2
+        return index
@@ -0,0 +1,50 @@
+import pytest
+
+from digical.lib import blocktree
+from digical.lib.maxtree import MaxTree
+
+
+def test_insert_delete():
+    """BlockTree.insert(int, value) -> None"""
+    """del BlockTree[int]"""
+    values = list(range(500))
+    tree = MaxTree(values)
+    for i in range(0, 500, 7):
+        tree.insert(i, 1000 + i)
+        values.insert(i, 1000 + i)
+    for i in range(0, 400, 3):
+        del tree[i]
+        del values[i]
+    tree.append(7)
+    values.append(7)
+    assert list(tree) == values
+    assert len(tree) == len(values)
+    assert tree[-1] == 7
+    with pytest.raises(IndexError):
+        tree[len(values)]
+
+
+def test_summary():
+    """BlockTree.summary(int, int) -> summary"""
+    values = [(i * 37) % 101 for i in range(1000)]
+    tree = MaxTree(values)
+    for start, end in [(0, 1000), (5, 6), (63, 200), (130, 129), (900, 2000)]:
+        assert tree.summary(start, end) == max(values[start:end], default=-1)
+    assert tree.summary() == 100
+
+
+def test_small_blocks(monkeypatch):
+    """BlockTree splits and drops blocks as values come and go"""
+    monkeypatch.setattr(blocktree, "BLOCK_SIZE", 2)
+    tree = MaxTree()
+    values = []
+    for i in range(50):
+        tree.insert(i // 2, i)
+        values.insert(i // 2, i)
+    assert list(tree) == values
+    assert tree.first_at_least(10, 40) == values.index(next(v for v in values[10:] if v >= 40))
+    while values:
+        del tree[len(values) // 2]
+        del values[len(values) // 2]
+        assert list(tree) == values
+    assert tree.first_at_least(0, 0) == -1
@@ -0,0 +1,333 @@
+from __future__ import annotations
+from array import array
+from typing import Callable, Dict, Iterator, Tuple, Union
+import bisect
+import operator
+
+from .time import MINUTES_PER_DAY
+from .timerange import Time, TimeRange
+from .schedule import Schedule
+from .bitmapschedule import _popcount, _runs
+
+# A chunk is either a bitmap (int) or a boundary array of offsets within
+# the chunk (start0, end0, start1, end1, ...), whichever is smaller
+Chunk = Union[int, array]
+
+
+class ChunkedSchedule:
+    """
+    A Schedule split into fixed-size chunks of the timeline (a day by
+    default). Each chunk is stored as a bitmap when it is fragmented and
+    as a boundary array when it holds a few long ranges.
+    """
+    __slots__ = ("_size", "_chunks")
+
+    def __init__(self, timeranges=(), size: int = MINUTES_PER_DAY):
+        """ChunkedSchedule() -> ChunkedSchedule"""
+        if size <= 0:
+            raise ValueError("Invalid ChunkedSchedule: size must be positive")
+        self._size = size
+        self._chunks: Dict[int, Chunk] = {}
+        for r in timeranges:
+            self.add(r)
+
+    @classmethod
+    def _from_chunks(cls, chunks: Dict[int, Chunk], size: int) -> ChunkedSchedule:
+        schedule = cls.__new__(cls)
+        schedule._size = size
+        schedule._chunks = chunks
+        return schedule
+
+    @classmethod
+    def from_schedule(cls, schedule: Schedule, size: int = MINUTES_PER_DAY) -> ChunkedSchedule:
+        """ChunkedSchedule.from_schedule(Schedule) -> ChunkedSchedule"""
+        return cls(schedule.timeranges, size)
+
+    @classmethod
+    def from_json(cls, j):
+        """ChunkedSchedule.from_json(dict) -> ChunkedSchedule"""
+        timeranges = [TimeRange.from_json(r) for r in j["timeranges"]]
+        return cls(timeranges, j["size"])
+
+    def to_json(self):
+        """ChunkedSchedule.to_json() -> dict"""
+        return {
+            "size": self._size,
+            "timeranges": [TimeRange.to_json(r) for r in self.timeranges]
+        }
+
+    def to_schedule(self) -> Schedule:
+        """ChunkedSchedule.to_schedule() -> Schedule"""
+        return Schedule.from_ranges(self.timeranges, normalized=True)
+
+    def copy(self) -> ChunkedSchedule:
+        """ChunkedSchedule.copy() -> ChunkedSchedule"""
+        chunks = {k: c if isinstance(c, int) else array("q", c) for k, c in self._chunks.items()}
+        return self._from_chunks(chunks, self._size)
+
+    def __repr__(self) -> str:
+        """repr(ChunkedSchedule) -> repr"""
+        return f"ChunkedSchedule({list(self.timeranges)!r}, size={self._size})"
+
+    def __str__(self) -> str:
+        """str(ChunkedSchedule) -> str"""
+        return "; ".join(str(r) for r in self.timeranges)
+
+    def __len__(self):
+        """len(ChunkedSchedule) -> int"""
+        return sum(_measure(c) for c in self._chunks.values())
+
+    @property
+    def size(self) -> int:
+        """ChunkedSchedule.size -> int"""
+        return self._size
+
+    @property
+    def bitmap_chunks(self) -> int:
+        """ChunkedSchedule.bitmap_chunks -> int"""
+        return sum(isinstance(c, int) for c in self._chunks.values())
+
+    @property
+    def array_chunks(self) -> int:
+        """ChunkedSchedule.array_chunks -> int"""
+        return len(self._chunks) - self.bitmap_chunks
+
+    @property
+    def timeranges(self):
+        """ChunkedSchedule.timeranges -> *TimeRange"""
+        return tuple(TimeRange(Time(start), Time(end)) for start, end in self._ranges())
+
+    def _ranges(self) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) for each range, joining ranges that cross chunks"""
+        pending = None
+        for key in sorted(self._chunks):
+            offset = key * self._size
+            for start, end in _chunk_runs(self._chunks[key]):
+                start += offset
+                end += offset
+                if pending is not None and pending[1] == start:
+                    pending = (pending[0], end)
+                    continue
+                if pending is not None:
+                    yield pending
+                pending = (start, end)
+        if pending is not None:
+            yield pending
+
+    def __eq__(self, other: ChunkedSchedule) -> bool:
+        """ChunkedSchedule == ChunkedSchedule -> bool"""
+        if isinstance(other, ChunkedSchedule):
+            return self._size == other._size and self._chunks.keys() == other._chunks.keys() and all(
+                _to_bits(c) == _to_bits(other._chunks[k]) for k, c in self._chunks.items()
+            )
+        else:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __contains__(self, other: Union[Time, TimeRange]) -> bool:
+        """Time in ChunkedSchedule -> bool"""
+        """TimeRange in ChunkedSchedule -> bool"""
+        if isinstance(other, Time):
+            key, offset = divmod(other.value, self._size)
+            chunk = self._chunks.get(key)
+            if chunk is None:
+                return False
+            if isinstance(chunk, int):
+                return bool(chunk >> offset & 1)
+            return bisect.bisect_right(chunk, offset) % 2 == 1
+        if isinstance(other, TimeRange):
+            for key, mask in self._masks(other):
+                chunk = self._chunks.get(key)
+                if chunk is None or _to_bits(chunk) & mask != mask:
+                    return False
+            return True
+        else:
+            return NotImplemented
+
+    def _masks(self, timerange: TimeRange) -> Iterator[Tuple[int, int]]:
+        """Yield (chunk, bitmask) for each chunk the range touches"""
+        start = timerange.start.value
+        end = timerange.end.value
+        for key in range(start // self._size, (end - 1) // self._size + 1):
+            offset = key * self._size
+            low = max(start - offset, 0)
+            high = min(end - offset, self._size)
+            yield key, ((1 << (high - low)) - 1) << low
+
+    def _store(self, key: int, bits: int) -> None:
+        if bits:
+            self._chunks[key] = _pack(bits, self._size)
+        else:
+            self._chunks.pop(key, None)
+
+    def add(self, timerange: TimeRange) -> None:
+        for key, mask in self._masks(timerange):
+            self._store(key, _to_bits(self._chunks.get(key, 0)) | mask)
+
+    def remove(self, timerange: TimeRange) -> None:
+        if timerange not in self:
+            raise KeyError
+        self.discard(timerange)
+
+    def discard(self, timerange: TimeRange) -> None:
+        for key, mask in self._masks(timerange):
+            if key in self._chunks:
+                self._store(key, _to_bits(self._chunks[key]) & ~mask)
+
+    def isdisjoint(self, other: ChunkedSchedule) -> bool:
+        self._check(other)
+        return not any(
+            _to_bits(c) & _to_bits(other._chunks[k])
+            for k, c in self._chunks.items() if k in other._chunks
+        )
+
+    def issubset(self, other: ChunkedSchedule) -> bool:
+        self._check(other)
+        return all(
+            k in self._chunks and _to_bits(c) & ~_to_bits(self._chunks[k]) == 0
+            for k, c in other._chunks.items()
+        )
+
+    def __le__(self, other: ChunkedSchedule) -> bool:
+        return other.issubset(self)
+
+    def __lt__(self, other: ChunkedSchedule) -> bool:
+        if self == other:
+            return False
+        return other.issubset(self)
+
+    def issuperset(self, other: ChunkedSchedule) -> bool:
+        return other.issubset(self)
+
+    def __ge__(self, other: ChunkedSchedule) -> bool:
+        return other.issuperset(self)
+
+    def __gt__(self, other: ChunkedSchedule) -> bool:
+        if self == other:
+            return False
+        return other.issuperset(self)
+
+    def _check(self, other: ChunkedSchedule) -> None:
+        if other._size != self._size:
+            raise ValueError("ChunkedSchedule chunk sizes differ")
+
+    def _combine(self, other: ChunkedSchedule, op: Callable[[int, int], int], keys) -> None:
+        """Apply a bitwise operation chunk by chunk over the given chunk keys"""
+        self._check(other)
+        for key in keys:
+            bits = op(_to_bits(self._chunks.get(key, 0)), _to_bits(other._chunks.get(key, 0)))
+            self._store(key, bits)
+
+    def union(self, *others: ChunkedSchedule) -> ChunkedSchedule:
+        schedule = self.copy()
+        schedule.update(*others)
+        return schedule
+
+    def __or__(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        if not isinstance(other, ChunkedSchedule):
+            return NotImplemented
+        return self.union(other)
+
+    def intersection(self, *others: ChunkedSchedule) -> ChunkedSchedule:
+        schedule = self.copy()
+        schedule.intersection_update(*others)
+        return schedule
+
+    def __and__(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        if not isinstance(other, ChunkedSchedule):
+            return NotImplemented
+        return self.intersection(other)
+
+    def difference(self, *others: ChunkedSchedule) -> ChunkedSchedule:
+        schedule = self.copy()
+        schedule.difference_update(*others)
+        return schedule
+
+    def __sub__(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        if not isinstance(other, ChunkedSchedule):
+            return NotImplemented
+        return self.difference(other)
+
+    def sub(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        return self.difference(other)
+
+    def symmetric_difference(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        schedule = self.copy()
+        schedule.symmetric_difference_update(other)
+        return schedule
+
+    def __xor__(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        if not isinstance(other, ChunkedSchedule):
+            return NotImplemented
+        return self.symmetric_difference(other)
+
+    def update(self, *others: ChunkedSchedule) -> None:
+        for other in others:
+            self._combine(other, operator.or_, list(other._chunks))
+
+    def __ior__(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        self.update(other)
+        return self
+
+    def intersection_update(self, *others: ChunkedSchedule) -> None:
+        for other in others:
+            self._combine(other, operator.and_, list(self._chunks))
+
+    def __iand__(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        self.intersection_update(other)
+        return self
+
+    def difference_update(self, *others: ChunkedSchedule) -> None:
+        for other in others:
+            keys = [k for k in other._chunks if k in self._chunks]
+            self._combine(other, _sub, keys)
+
+    def __isub__(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        self.difference_update(other)
+        return self
+
+    def symmetric_difference_update(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        self._combine(other, operator.xor, list(other._chunks))
+        return self
+
+    def __ixor__(self, other: ChunkedSchedule) -> ChunkedSchedule:
+        return self.symmetric_difference_update(other)
+
+
+def _sub(bits_a: int, bits_b: int) -> int:
+    return bits_a & ~bits_b
+
+
+def _to_bits(chunk: Chunk) -> int:
+    if isinstance(chunk, int):
+        return chunk
+    bits = 0
+    for i in range(0, len(chunk), 2):
+        bits |= ((1 << (chunk[i + 1] - chunk[i])) - 1) << chunk[i]
+    return bits
+
+
+def _chunk_runs(chunk: Chunk) -> Iterator[Tuple[int, int]]:
+    if isinstance(chunk, int):
+        return _runs(chunk)
+    return zip(chunk[::2], chunk[1::2])
+
+
+def _measure(chunk: Chunk) -> int:
+    if isinstance(chunk, int):
+        return _popcount(chunk)
+    return sum(chunk[1::2]) - sum(chunk[::2])
+
+
+def _pack(bits: int, size: int) -> Chunk:
+    """Pick the smaller representation for a chunk's bits"""
+    # Each range costs two 64-bit boundaries, the bitmap one bit per minute
+    ranges = _popcount(bits & ~(bits << 1))
+    if ranges * 128 > size:
+        return bits
+    chunk = array("q")
+    for start, end in _runs(bits):
+        chunk.append(start)
+        chunk.append(end)
+    return chunk
@@ -0,0 +1,114 @@
+import pytest
+
+from digical import Time, TimeRange, Schedule, ChunkedSchedule
+
+
+def test_init():
+    """ChunkedSchedule() -> ChunkedSchedule"""
+    schedule = ChunkedSchedule([
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2000), Time(2200))
+    ])
+    assert schedule.size == 1440
+    assert schedule.timeranges == (
+        TimeRange(Time(1000), Time(2200)),
+        TimeRange(Time(2500), Time(3000))
+    )
+    with pytest.raises(ValueError):
+        ChunkedSchedule(size=0)
+
+
+def test_representation():
+    """ChunkedSchedule picks a representation per chunk"""
+    schedule = ChunkedSchedule([
+        TimeRange(Time.from_dhm(0, 9, 0), Time.from_dhm(0, 17, 0))
+    ])
+    schedule.update(ChunkedSchedule([
+        TimeRange(Time.from_dhm(1, 0, i * 30), Time.from_dhm(1, 0, i * 30 + 15))
+        for i in range(48)
+    ]))
+    assert schedule.array_chunks == 1
+    assert schedule.bitmap_chunks == 1
+    schedule.discard(TimeRange(Time.from_dhm(1, 0, 0), Time.from_dhm(2, 0, 0)))
+    assert schedule.array_chunks == 1
+    assert schedule.bitmap_chunks == 0
+
+
+def test_from_schedule():
+    """ChunkedSchedule.from_schedule(Schedule) -> ChunkedSchedule"""
+    """ChunkedSchedule.to_schedule() -> Schedule"""
+    schedule = Schedule([
+        TimeRange(Time(-100), Time(100)),
+        TimeRange(Time(1000), Time(5000)),
+        TimeRange(Time(10079), Time(10080))
+    ])
+    chunked = ChunkedSchedule.from_schedule(schedule)
+    assert chunked.to_schedule() == schedule
+    assert ChunkedSchedule.from_json(chunked.to_json()) == chunked
+    assert len(chunked) == len(schedule)
+
+
+def test_contains():
+    """Time in ChunkedSchedule -> bool"""
+    """TimeRange in ChunkedSchedule -> bool"""
+    schedule = ChunkedSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert (Time(500) in schedule) is False
+    assert (Time(1000) in schedule) is True
+    assert (Time(1440) in schedule) is True
+    assert (Time(2000) in schedule) is False
+    assert (TimeRange(Time(1200), Time(1800)) in schedule) is True
+    assert (TimeRange(Time(1200), Time(2800)) in schedule) is False
+
+
+def test_add_discard():
+    """ChunkedSchedule.add(TimeRange) -> None"""
+    """ChunkedSchedule.discard(TimeRange) -> None"""
+    schedule = ChunkedSchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    schedule.add(TimeRange(Time(2000), Time(2500)))
+    schedule.discard(TimeRange(Time(1200), Time(1300)))
+    assert schedule.timeranges == (
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(1300), Time(2500))
+    )
+    with pytest.raises(KeyError):
+        schedule.remove(TimeRange(Time(1100), Time(1400)))
+
+
+def test_set_operations():
+    """ChunkedSchedule | & - ^ ChunkedSchedule -> ChunkedSchedule"""
+    schedule_a = ChunkedSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule_b = ChunkedSchedule([
+        TimeRange(Time(1200), Time(2200)),
+        TimeRange(Time(2700), Time(3200))
+    ])
+    assert (schedule_a | schedule_b).timeranges == (
+        TimeRange(Time(1000), Time(2200)),
+        TimeRange(Time(2500), Time(3200))
+    )
+    assert (schedule_a & schedule_b).timeranges == (
+        TimeRange(Time(1200), Time(2000)),
+        TimeRange(Time(2700), Time(3000))
+    )
+    assert (schedule_a - schedule_b).timeranges == (
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(2500), Time(2700))
+    )
+    assert (schedule_a ^ schedule_b).timeranges == (
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(2000), Time(2200)),
+        TimeRange(Time(2500), Time(2700)),
+        TimeRange(Time(3000), Time(3200))
+    )
+    assert not schedule_a.isdisjoint(schedule_b)
+    assert (schedule_a & schedule_b) <= schedule_a
+    with pytest.raises(ValueError):
+        schedule_a & ChunkedSchedule(size=60)
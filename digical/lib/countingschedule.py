@@ -0,0 +1,197 @@
+from __future__ import annotations
+from typing import Dict, Iterator, List, Tuple, Union
+import bisect
+
+from .timerange import Time, TimeRange
+from .schedule import Schedule
+from .blocktree import BlockTree
+
+# (count change at a boundary, minutes until the next boundary)
+Boundary = Tuple[int, int]
+# (total count change, lowest count reached, minutes spent at that count)
+Coverage = Tuple[int, float, int]
+
+
+class _CoverageTree(BlockTree):
+    """A BlockTree of boundaries summarised by the lowest coverage count they reach"""
+    __slots__ = ()
+
+    _identity: Coverage = (0, float("inf"), 0)
+
+    def _summarize(self, values: List[Boundary]) -> Coverage:
+        total = 0
+        lowest = float("inf")
+        minutes = 0
+        for delta, length in values:
+            total += delta
+            if total < lowest:
+                lowest = total
+                minutes = length
+            elif total == lowest:
+                minutes += length
+        return total, lowest, minutes
+
+    def _combine(self, a: Coverage, b: Coverage) -> Coverage:
+        lowest = a[0] + b[1]
+        if a[1] < lowest:
+            return a[0] + b[0], a[1], a[2]
+        if a[1] > lowest:
+            return a[0] + b[0], lowest, b[2]
+        return a[0] + b[0], lowest, a[2] + b[2]
+
+
+class CountingSchedule:
+    """
+    A multiset of TimeRanges that keeps how many ranges cover each
+    minute. Coverage is stored as a sorted boundary map of count changes,
+    so adding or discarding a range only touches its two boundaries, and
+    the boundaries sit in a BlockTree so counts are answered in O(log n).
+    """
+    __slots__ = ("_times", "_boundaries", "_timeranges")
+
+    def __init__(self, timeranges=()):
+        """CountingSchedule() -> CountingSchedule"""
+        self._times: List[int] = []
+        self._boundaries = _CoverageTree()
+        self._timeranges: Dict[TimeRange, int] = {}
+        for r in timeranges:
+            self.add(r)
+
+    @classmethod
+    def from_json(cls, j):
+        """CountingSchedule.from_json(dict) -> CountingSchedule"""
+        timeranges = [TimeRange.from_json(r) for r in j["timeranges"]]
+        return cls(timeranges)
+
+    def to_json(self):
+        """CountingSchedule.to_json() -> dict"""
+        return {
+            "timeranges": [TimeRange.to_json(r) for r in self.timeranges]
+        }
+
+    def to_schedule(self) -> Schedule:
+        """CountingSchedule.to_schedule() -> Schedule"""
+        return self.at_least(1)
+
+    def copy(self) -> CountingSchedule:
+        """CountingSchedule.copy() -> CountingSchedule"""
+        schedule = CountingSchedule.__new__(CountingSchedule)
+        schedule._times = self._times.copy()
+        schedule._boundaries = _CoverageTree(self._boundaries)
+        schedule._timeranges = self._timeranges.copy()
+        return schedule
+
+    def __repr__(self) -> str:
+        """repr(CountingSchedule) -> repr"""
+        return f"CountingSchedule({list(self.timeranges)!r})"
+
+    def __str__(self) -> str:
+        """str(CountingSchedule) -> str"""
+        return "; ".join(f"{r} x{count}" for r, count in self.segments())
+
+    def __len__(self):
+        """len(CountingSchedule) -> int"""
+        if not self._times:
+            return 0
+        # Counts never go negative, so the lowest count reached is 0
+        _, _, uncovered = self._boundaries.summary()
+        return self._times[-1] - self._times[0] - uncovered
+
+    @property
+    def timeranges(self):
+        """CountingSchedule.timeranges -> *TimeRange"""
+        return tuple(
+            r for r in sorted(self._timeranges)
+            for _ in range(self._timeranges[r])
+        )
+
+    def __eq__(self, other: CountingSchedule) -> bool:
+        """CountingSchedule == CountingSchedule -> bool"""
+        if isinstance(other, CountingSchedule):
+            return self._timeranges == other._timeranges
+        else:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __contains__(self, other: Union[Time, TimeRange]) -> bool:
+        """Time in CountingSchedule -> bool"""
+        """TimeRange in CountingSchedule -> bool"""
+        if isinstance(other, Time):
+            return self.count(other) > 0
+        if isinstance(other, TimeRange):
+            i = bisect.bisect_right(self._times, other.start.value)
+            j = bisect.bisect_left(self._times, other.end.value, i)
+            count = self._boundaries.summary(0, i)[0]
+            return count > 0 and count + self._boundaries.summary(i, j)[1] > 0
+        else:
+            return NotImplemented
+
+    def count(self, time: Time) -> int:
+        """CountingSchedule.count(Time) -> int"""
+        i = bisect.bisect_right(self._times, time.value)
+        return self._boundaries.summary(0, i)[0]
+
+    def _shift(self, time: int, delta: int) -> None:
+        """Add `delta` to the count change at `time`, dropping it once it cancels out"""
+        times = self._times
+        boundaries = self._boundaries
+        i = bisect.bisect_left(times, time)
+        if i < len(times) and times[i] == time:
+            delta += boundaries[i][0]
+            if delta:
+                boundaries[i] = (delta, boundaries[i][1])
+                return
+            del times[i]
+            del boundaries[i]
+        else:
+            times.insert(i, time)
+            boundaries.insert(i, (delta, times[i + 1] - time if i + 1 < len(times) else 0))
+        if i:
+            length = times[i] - times[i - 1] if i < len(times) else 0
+            boundaries[i - 1] = (boundaries[i - 1][0], length)
+
+    def add(self, timerange: TimeRange) -> None:
+        self._timeranges[timerange] = self._timeranges.get(timerange, 0) + 1
+        self._shift(timerange.start.value, 1)
+        self._shift(timerange.end.value, -1)
+
+    def remove(self, timerange: TimeRange) -> None:
+        if timerange not in self._timeranges:
+            raise KeyError
+        self.discard(timerange)
+
+    def discard(self, timerange: TimeRange) -> None:
+        count = self._timeranges.get(timerange)
+        if count is None:
+            return
+        if count == 1:
+            del self._timeranges[timerange]
+        else:
+            self._timeranges[timerange] = count - 1
+        self._shift(timerange.start.value, -1)
+        self._shift(timerange.end.value, 1)
+
+    def segments(self) -> Iterator[Tuple[TimeRange, int]]:
+        """CountingSchedule.segments() -> *(TimeRange, int)"""
+        count = 0
+        for time, (delta, length) in zip(self._times, self._boundaries):
+            count += delta
+            if count:
+                yield TimeRange(Time(time), Time(time + length)), count
+
+    def at_least(self, k: int) -> Schedule:
+        """CountingSchedule.at_least(int) -> Schedule"""
+        if k <= 0:
+            raise ValueError("Invalid count: k must be positive")
+        timeranges = []
+        start = None
+        count = 0
+        for time, (delta, _) in zip(self._times, self._boundaries):
+            count += delta
+            if start is None and count >= k:
+                start = time
+            elif start is not None and count < k:
+                timeranges.append(TimeRange(Time(start), Time(time)))
+                start = None
+        return Schedule.from_ranges(timeranges, normalized=True)
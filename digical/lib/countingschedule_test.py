@@ -0,0 +1,126 @@
+import pytest
+
+from digical import Time, TimeRange, Schedule, CountingSchedule
+
+
+def test_init():
+    """CountingSchedule() -> CountingSchedule"""
+    schedule_empty = CountingSchedule()
+    assert len(schedule_empty) == 0
+    assert schedule_empty.to_schedule() == Schedule()
+    schedule = CountingSchedule([
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(1000), Time(2000))
+    ])
+    assert schedule.timeranges == (
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    )
+    assert len(schedule) == 1500
+
+
+def test_json():
+    """CountingSchedule.to_json() -> dict"""
+    schedule = CountingSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(1500), Time(2500))
+    ])
+    assert CountingSchedule.from_json(schedule.to_json()) == schedule
+
+
+def test_count():
+    """CountingSchedule.count(Time) -> int"""
+    schedule = CountingSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(1500), Time(2500))
+    ])
+    assert schedule.count(Time(500)) == 0
+    assert schedule.count(Time(1000)) == 1
+    assert schedule.count(Time(1500)) == 2
+    assert schedule.count(Time(2000)) == 1
+    assert schedule.count(Time(2500)) == 0
+    assert (Time(2200) in schedule) is True
+    assert (TimeRange(Time(1200), Time(2400)) in schedule) is True
+    assert (TimeRange(Time(1200), Time(2600)) in schedule) is False
+
+
+def test_segments():
+    """CountingSchedule.segments() -> *(TimeRange, int)"""
+    schedule = CountingSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(1500), Time(2500)),
+        TimeRange(Time(3000), Time(3500))
+    ])
+    assert list(schedule.segments()) == [
+        (TimeRange(Time(1000), Time(1500)), 1),
+        (TimeRange(Time(1500), Time(2000)), 2),
+        (TimeRange(Time(2000), Time(2500)), 1),
+        (TimeRange(Time(3000), Time(3500)), 1)
+    ]
+
+
+def test_at_least():
+    """CountingSchedule.at_least(int) -> Schedule"""
+    schedule = CountingSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(1500), Time(2500)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert schedule.at_least(1) == Schedule([
+        TimeRange(Time(1000), Time(3000))
+    ])
+    assert schedule.at_least(2) == Schedule([
+        TimeRange(Time(1500), Time(2000))
+    ])
+    assert schedule.at_least(3) == Schedule()
+    with pytest.raises(ValueError):
+        schedule.at_least(0)
+
+
+def test_discard():
+    """CountingSchedule.discard(TimeRange) -> None"""
+    schedule = CountingSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(1500), Time(2500))
+    ])
+    schedule.discard(TimeRange(Time(1000), Time(2000)))
+    assert schedule.to_schedule() == Schedule([
+        TimeRange(Time(1500), Time(2500))
+    ])
+    schedule.discard(TimeRange(Time(1000), Time(2000)))
+    assert schedule.to_schedule() == Schedule([
+        TimeRange(Time(1500), Time(2500))
+    ])
+    with pytest.raises(KeyError):
+        schedule.remove(TimeRange(Time(1000), Time(2000)))
+    schedule.remove(TimeRange(Time(1500), Time(2500)))
+    assert schedule == CountingSchedule()
+    assert list(schedule.segments()) == []
+
+
+def test_copy():
+    """CountingSchedule.copy() -> CountingSchedule"""
+    schedule = CountingSchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    schedule_copy = schedule.copy()
+    schedule_copy.add(TimeRange(Time(1500), Time(2500)))
+    assert schedule.count(Time(1500)) == 1
+    assert schedule_copy.count(Time(1500)) == 2
+
+
+def test_matches_schedule():
+    """CountingSchedule queries agree with its projected Schedule"""
+    schedule = CountingSchedule([
+        TimeRange(Time(i * 100), Time(i * 100 + 60 + i % 3 * 30)) for i in range(300)
+    ])
+    for i in range(0, 300, 4):
+        schedule.discard(TimeRange(Time(i * 100), Time(i * 100 + 60 + i % 3 * 30)))
+    projected = schedule.to_schedule()
+    assert len(schedule) == len(projected)
+    for t in range(0, 30500, 37):
+        assert (Time(t) in schedule) is (Time(t) in projected)
+        timerange = TimeRange(Time(t), Time(t + 45))
+        assert (timerange in schedule) is (timerange in projected)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from .schedule import Schedule, _BaseSchedule
+
+
+class FrozenSchedule(_BaseSchedule):
+    """An immutable, hashable Schedule"""
+    __slots__ = ("_hash", )
+
+    def __init__(self, timeranges=()):
+        """FrozenSchedule() -> FrozenSchedule"""
+        super().__init__(timeranges)
+        self._hash = None
+
+    @classmethod
+    def from_schedule(cls, schedule: _BaseSchedule) -> FrozenSchedule:
+        """FrozenSchedule.from_schedule(Schedule) -> FrozenSchedule"""
+        if isinstance(schedule, FrozenSchedule):
+            return schedule
+        return cls.from_ranges(schedule._timeranges, normalized=True)
+
+    def to_schedule(self) -> Schedule:
+        """FrozenSchedule.to_schedule() -> Schedule"""
+        return Schedule.from_ranges(self._timeranges, normalized=True)
+
+    def copy(self) -> FrozenSchedule:
+        """FrozenSchedule.copy() -> FrozenSchedule"""
+        return self
+
+    def __hash__(self) -> int:
+        """hash(FrozenSchedule) -> int"""
+        if self._hash is None:
+            self._hash = hash(tuple(self._timeranges))
+        return self._hash
+
+    def __eq__(self, other: _BaseSchedule) -> bool:
+        """FrozenSchedule == Schedule -> bool"""
+        if isinstance(other, FrozenSchedule) and self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return super().__eq__(other)
@@ -0,0 +1,124 @@
+import pickle
+
+import pytest
+
+from digical import Time, TimeRange, Schedule, FrozenSchedule
+
+
+def test_init():
+    """FrozenSchedule() -> FrozenSchedule"""
+    schedule = FrozenSchedule([
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2000), Time(2200))
+    ])
+    assert schedule.timeranges == (
+        TimeRange(Time(1000), Time(2200)),
+        TimeRange(Time(2500), Time(3000))
+    )
+    assert repr(FrozenSchedule()) == "FrozenSchedule([])"
+
+
+def test_from_schedule():
+    """FrozenSchedule.from_schedule(Schedule) -> FrozenSchedule"""
+    """FrozenSchedule.to_schedule() -> Schedule"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    frozen = FrozenSchedule.from_schedule(schedule)
+    assert isinstance(frozen, FrozenSchedule)
+    assert frozen == schedule
+    schedule.add(TimeRange(Time(4000), Time(5000)))
+    assert frozen != schedule
+    thawed = frozen.to_schedule()
+    assert isinstance(thawed, Schedule)
+    assert thawed == frozen
+    assert FrozenSchedule.from_schedule(frozen) is frozen
+
+
+def test_hash():
+    """hash(FrozenSchedule) -> int"""
+    schedule_a = FrozenSchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    schedule_b = FrozenSchedule([
+        TimeRange(Time(1000), Time(1500)),
+        TimeRange(Time(1500), Time(2000))
+    ])
+    schedule_c = FrozenSchedule([
+        TimeRange(Time(1000), Time(2500))
+    ])
+    assert hash(schedule_a) == hash(schedule_b)
+    assert len({schedule_a, schedule_b, schedule_c}) == 2
+    cache = {schedule_a: "a"}
+    assert cache[schedule_b] == "a"
+    assert schedule_a != schedule_c
+    with pytest.raises(TypeError):
+        hash(Schedule())
+
+
+def test_immutable():
+    """FrozenSchedule has no mutating methods"""
+    schedule = FrozenSchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    assert not hasattr(schedule, "add")
+    assert not hasattr(schedule, "update")
+    schedule_orig = schedule
+    schedule |= FrozenSchedule([
+        TimeRange(Time(3000), Time(4000))
+    ])
+    assert schedule is not schedule_orig
+    assert schedule_orig == FrozenSchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    assert schedule.copy() is schedule
+
+
+def test_set_operations():
+    """FrozenSchedule | & - ^ Schedule -> FrozenSchedule"""
+    schedule_a = FrozenSchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule_b = Schedule([
+        TimeRange(Time(1200), Time(2200)),
+        TimeRange(Time(2700), Time(3200))
+    ])
+    union = schedule_a | schedule_b
+    assert isinstance(union, FrozenSchedule)
+    assert union == Schedule([
+        TimeRange(Time(1000), Time(2200)),
+        TimeRange(Time(2500), Time(3200))
+    ])
+    assert isinstance(schedule_b | schedule_a, Schedule)
+    assert schedule_a & schedule_b == FrozenSchedule([
+        TimeRange(Time(1200), Time(2000)),
+        TimeRange(Time(2700), Time(3000))
+    ])
+    assert schedule_a - schedule_b == FrozenSchedule([
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(2500), Time(2700))
+    ])
+    assert schedule_a ^ schedule_b == FrozenSchedule([
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(2000), Time(2200)),
+        TimeRange(Time(2500), Time(2700)),
+        TimeRange(Time(3000), Time(3200))
+    ])
+    assert schedule_a + 500 == FrozenSchedule([
+        TimeRange(Time(1500), Time(2500)),
+        TimeRange(Time(3000), Time(3500))
+    ])
+    assert Time(1500) in schedule_a
+    assert len(schedule_a) == 1500
+
+
+def test_pickle():
+    """pickle.loads(pickle.dumps(FrozenSchedule)) -> FrozenSchedule"""
+    schedule = FrozenSchedule([
+        TimeRange(Time(1000), Time(2000))
+    ])
+    hash(schedule)
+    assert pickle.loads(pickle.dumps(schedule)) == schedule
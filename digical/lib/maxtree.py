@@ -0,0 +1,42 @@
+from __future__ import annotations
+from typing import List
+
+from .blocktree import BlockTree
+
+
+class MaxTree(BlockTree):
+    """
+    A BlockTree over non-negative integers summarised by their maximum,
+    answering range maximum and "first value at least x" queries.
+    """
+    __slots__ = ()
+
+    # Summary of no values; below every value the tree is meant for
+    _identity = -1
+
+    def _summarize(self, values: List[int]) -> int:
+        return max(values, default=-1)
+
+    def _combine(self, a: int, b: int) -> int:
+        return a if a >= b else b
+
+    def argmax(self, start: int, end: int) -> int:
+        """
+        MaxTree.argmax(int, int) -> int
+
+        Index of the first largest value in [start, end), or -1 if empty.
+        """
+        end = min(end, len(self))
+        best = self.summary(start, end)
+        if best < 0:
+            return -1
+        index = self.first_at_least(start, best)
+        return index if index < end else -1
+
+    def first_at_least(self, start: int, value: int) -> int:
+        """
+        MaxTree.first_at_least(int, int) -> int
+
+        Index of the first value >= `value` at or after `start`, or -1.
+        """
+        return self.find(start, lambda summary: summary >= value)
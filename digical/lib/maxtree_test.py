@@ -0,0 +1,44 @@
+import pytest
+
+from digical.lib.maxtree import MaxTree
+
+
+def test_init():
+    """MaxTree(*int) -> MaxTree"""
+    tree = MaxTree([3, 1, 4, 1, 5])
+    assert len(tree) == 5
+    assert [tree[i] for i in range(5)] == [3, 1, 4, 1, 5]
+    with pytest.raises(IndexError):
+        tree[5]
+    assert len(MaxTree()) == 0
+
+
+def test_setitem():
+    """MaxTree[int] = int"""
+    tree = MaxTree([3, 1, 4, 1, 5])
+    tree[1] = 9
+    assert tree[1] == 9
+    assert tree.argmax(0, 5) == 1
+    with pytest.raises(IndexError):
+        tree[5] = 1
+
+
+def test_argmax():
+    """MaxTree.argmax(int, int) -> int"""
+    tree = MaxTree([3, 1, 4, 1, 5, 4])
+    assert tree.argmax(0, 6) == 4
+    assert tree.argmax(0, 4) == 2
+    assert tree.argmax(1, 2) == 1
+    assert tree.argmax(5, 6) == 5
+    assert tree.argmax(3, 3) == -1
+    assert MaxTree([2, 2, 2]).argmax(0, 3) == 0
+
+
+def test_first_at_least():
+    """MaxTree.first_at_least(int, int) -> int"""
+    tree = MaxTree([3, 1, 4, 1, 5, 4])
+    assert tree.first_at_least(0, 4) == 2
+    assert tree.first_at_least(3, 4) == 4
+    assert tree.first_at_least(5, 4) == 5
+    assert tree.first_at_least(0, 6) == -1
+    assert tree.first_at_least(6, 0) == -1
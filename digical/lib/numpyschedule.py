@@ -0,0 +1,361 @@
+from __future__ import annotations
+from typing import Callable, Sequence, Union
+
+from .timerange import Time, TimeRange
+from .schedule import Schedule
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class NumpySchedule:
+    """
+    A Schedule that stores its boundaries in a NumPy int64 array
+    (start0, end0, start1, end1, ...) so set operations, membership and
+    length are vectorized. Requires numpy.
+    """
+    __slots__ = ("_bounds", )
+
+    def __init__(self, timeranges=()):
+        """NumpySchedule() -> NumpySchedule"""
+        _require_numpy()
+        timeranges = list(timeranges)
+        starts = np.array([r.start.value for r in timeranges], dtype=np.int64)
+        ends = np.array([r.end.value for r in timeranges], dtype=np.int64)
+        self._bounds = _coalesce(starts, ends)
+
+    @classmethod
+    def from_arrays(cls, starts, ends) -> NumpySchedule:
+        """NumpySchedule.from_arrays(array, array) -> NumpySchedule"""
+        _require_numpy()
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        if np.any(starts >= ends):
+            raise ValueError("Invalid TimeRange: start must be less than end")
+        return cls._from_bounds(_coalesce(starts, ends))
+
+    @classmethod
+    def from_schedule(cls, schedule: Schedule) -> NumpySchedule:
+        """NumpySchedule.from_schedule(Schedule) -> NumpySchedule"""
+        _require_numpy()
+        bounds = np.array([t.value for r in schedule.timeranges for t in (r.start, r.end)], dtype=np.int64)
+        return cls._from_bounds(bounds)
+
+    @classmethod
+    def from_json(cls, j):
+        """NumpySchedule.from_json(dict) -> NumpySchedule"""
+        timeranges = [TimeRange.from_json(r) for r in j["timeranges"]]
+        return cls(timeranges)
+
+    @classmethod
+    def _from_bounds(cls, bounds) -> NumpySchedule:
+        schedule = cls.__new__(cls)
+        schedule._bounds = bounds
+        return schedule
+
+    def to_json(self):
+        """NumpySchedule.to_json() -> dict"""
+        return {
+            "timeranges": [TimeRange.to_json(r) for r in self.timeranges]
+        }
+
+    def to_schedule(self) -> Schedule:
+        """NumpySchedule.to_schedule() -> Schedule"""
+        return Schedule.from_ranges(self.timeranges, normalized=True)
+
+    def copy(self) -> NumpySchedule:
+        """NumpySchedule.copy() -> NumpySchedule"""
+        return self._from_bounds(self._bounds.copy())
+
+    def __repr__(self) -> str:
+        """repr(NumpySchedule) -> repr"""
+        return f"NumpySchedule({list(self.timeranges)!r})"
+
+    def __str__(self) -> str:
+        """str(NumpySchedule) -> str"""
+        return "; ".join(str(r) for r in self.timeranges)
+
+    def __len__(self):
+        """len(NumpySchedule) -> int"""
+        return int((self._bounds[1::2] - self._bounds[::2]).sum())
+
+    @property
+    def timeranges(self):
+        """NumpySchedule.timeranges -> *TimeRange"""
+        bounds = self._bounds.tolist()
+        return tuple(
+            TimeRange(Time(start), Time(end))
+            for start, end in zip(bounds[::2], bounds[1::2])
+        )
+
+    @property
+    def starts(self):
+        """NumpySchedule.starts -> array"""
+        return self._bounds[::2]
+
+    @property
+    def ends(self):
+        """NumpySchedule.ends -> array"""
+        return self._bounds[1::2]
+
+    def __eq__(self, other: NumpySchedule) -> bool:
+        """NumpySchedule == NumpySchedule -> bool"""
+        if isinstance(other, NumpySchedule):
+            return bool(np.array_equal(self._bounds, other._bounds))
+        else:
+            return NotImplemented
+
+    def __add__(self, other: Union[int, NumpySchedule]) -> NumpySchedule:
+        """NumpySchedule + int -> NumpySchedule"""
+        if isinstance(other, int):
+            return self._from_bounds(self._bounds + other)
+        if isinstance(other, NumpySchedule):
+            return self.union(other)
+        else:
+            return NotImplemented
+
+    def __sub__(self, other: Union[int, NumpySchedule]) -> NumpySchedule:
+        """NumpySchedule - int -> NumpySchedule"""
+        if isinstance(other, int):
+            return self._from_bounds(self._bounds - other)
+        if isinstance(other, NumpySchedule):
+            return self.difference(other)
+        else:
+            return NotImplemented
+
+    def __radd__(self, other: int) -> NumpySchedule:
+        """int + NumpySchedule -> NumpySchedule"""
+        if isinstance(other, int):
+            return self.__add__(other)
+        else:
+            return NotImplemented
+
+    def __iadd__(self, other: Union[int, NumpySchedule]) -> NumpySchedule:
+        """NumpySchedule += int -> None"""
+        if isinstance(other, int):
+            self._bounds = self._bounds + other
+            return self
+        if isinstance(other, NumpySchedule):
+            self.update(other)
+            return self
+        else:
+            return NotImplemented
+
+    def __isub__(self, other: Union[int, NumpySchedule]) -> NumpySchedule:
+        """NumpySchedule -= int -> None"""
+        if isinstance(other, int):
+            self._bounds = self._bounds - other
+            return self
+        if isinstance(other, NumpySchedule):
+            self.difference_update(other)
+            return self
+        else:
+            return NotImplemented
+
+    def __contains__(self, other: Union[Time, TimeRange]) -> bool:
+        """Time in NumpySchedule -> bool"""
+        """TimeRange in NumpySchedule -> bool"""
+        if isinstance(other, Time):
+            return int(np.searchsorted(self._bounds, other.value, side="right")) % 2 == 1
+        if isinstance(other, TimeRange):
+            i = int(np.searchsorted(self._bounds, other.start.value, side="right"))
+            return i % 2 == 1 and bool(other.end.value <= self._bounds[i])
+        else:
+            return NotImplemented
+
+    def contains_many(self, times):
+        """NumpySchedule.contains_many(array) -> bool array"""
+        if not isinstance(times, np.ndarray):
+            times = np.fromiter((t.value if isinstance(t, Time) else t for t in times), dtype=np.int64)
+        return np.searchsorted(self._bounds, times, side="right") % 2 == 1
+
+    def measure_many(self, timeranges):
+        """NumpySchedule.measure_many(*TimeRange) -> int array"""
+        windows = list(timeranges)
+        starts = np.fromiter((r.start.value for r in windows), dtype=np.int64, count=len(windows))
+        ends = np.fromiter((r.end.value for r in windows), dtype=np.int64, count=len(windows))
+        return self._measure_before(ends) - self._measure_before(starts)
+
+    def _measure_before(self, values):
+        """Minutes covered before each value"""
+        starts = self._bounds[::2]
+        ends = self._bounds[1::2]
+        cumulative = np.concatenate(([0], np.cumsum(ends - starts)))
+        i = np.searchsorted(ends, values, side="right")
+        partial = values - starts[np.minimum(i, len(starts) - 1)] if len(starts) else 0
+        return cumulative[i] + np.where(i < len(starts), np.clip(partial, 0, None), 0)
+
+    def add(self, timerange: TimeRange) -> None:
+        start = timerange.start.value
+        end = timerange.end.value
+        i = int(np.searchsorted(self._bounds, start, side="left"))
+        j = int(np.searchsorted(self._bounds, end, side="right"))
+        bounds = [b for b, keep in ((start, i % 2 == 0), (end, j % 2 == 0)) if keep]
+        self._bounds = np.concatenate((self._bounds[:i], np.array(bounds, dtype=np.int64), self._bounds[j:]))
+
+    def remove(self, timerange: TimeRange) -> None:
+        if timerange not in self:
+            raise KeyError
+        self.discard(timerange)
+
+    def discard(self, timerange: TimeRange) -> None:
+        start = timerange.start.value
+        end = timerange.end.value
+        i = int(np.searchsorted(self._bounds, start, side="left"))
+        j = int(np.searchsorted(self._bounds, end, side="right"))
+        bounds = [b for b, keep in ((start, i % 2 == 1), (end, j % 2 == 1)) if keep]
+        self._bounds = np.concatenate((self._bounds[:i], np.array(bounds, dtype=np.int64), self._bounds[j:]))
+
+    def pop(self) -> TimeRange:
+        if not len(self._bounds):
+            raise KeyError
+        start, end = self._bounds[-2:].tolist()
+        self._bounds = self._bounds[:-2]
+        return TimeRange(Time(start), Time(end))
+
+    def isdisjoint(self, other: NumpySchedule) -> bool:
+        return not len(_merge(self._bounds, other._bounds, np.logical_and))
+
+    def issubset(self, other: NumpySchedule) -> bool:
+        return not len(_merge(other._bounds, self._bounds, _sub))
+
+    def __le__(self, other: NumpySchedule) -> bool:
+        return other.issubset(self)
+
+    def __lt__(self, other: NumpySchedule) -> bool:
+        if self == other:
+            return False
+        return other.issubset(self)
+
+    def issuperset(self, other: NumpySchedule) -> bool:
+        return other.issubset(self)
+
+    def __ge__(self, other: NumpySchedule) -> bool:
+        return other.issuperset(self)
+
+    def __gt__(self, other: NumpySchedule) -> bool:
+        if self == other:
+            return False
+        return other.issuperset(self)
+
+    def union(self, *others: NumpySchedule) -> NumpySchedule:
+        schedule = self.copy()
+        schedule.update(*others)
+        return schedule
+
+    def __or__(self, other: NumpySchedule) -> NumpySchedule:
+        return self.union(other)
+
+    def intersection(self, *others: NumpySchedule) -> NumpySchedule:
+        schedule = self.copy()
+        schedule.intersection_update(*others)
+        return schedule
+
+    def __and__(self, other: NumpySchedule) -> NumpySchedule:
+        return self.intersection(other)
+
+    def difference(self, *others: NumpySchedule) -> NumpySchedule:
+        schedule = self.copy()
+        schedule.difference_update(*others)
+        return schedule
+
+    def sub(self, other: NumpySchedule) -> NumpySchedule:
+        return self.difference(other)
+
+    def symmetric_difference(self, other: NumpySchedule) -> NumpySchedule:
+        return self._from_bounds(_merge(self._bounds, other._bounds, np.logical_xor))
+
+    def __xor__(self, other: NumpySchedule) -> NumpySchedule:
+        return self.symmetric_difference(other)
+
+    def update(self, *others: NumpySchedule) -> None:
+        if len(others) == 1:
+            self._bounds = _merge(self._bounds, others[0]._bounds, np.logical_or)
+        elif others:
+            self._bounds = _sweep([self._bounds] + [o._bounds for o in others], 1)
+
+    def __ior__(self, other: NumpySchedule) -> NumpySchedule:
+        self.update(other)
+        return self
+
+    def intersection_update(self, *others: NumpySchedule) -> None:
+        if len(others) == 1:
+            self._bounds = _merge(self._bounds, others[0]._bounds, np.logical_and)
+        elif others:
+            self._bounds = _sweep([self._bounds] + [o._bounds for o in others], len(others) + 1)
+
+    def __iand__(self, other: NumpySchedule) -> NumpySchedule:
+        self.intersection_update(other)
+        return self
+
+    def difference_update(self, *others: NumpySchedule) -> None:
+        if len(others) == 1:
+            self._bounds = _merge(self._bounds, others[0]._bounds, _sub)
+        elif others:
+            subtracted = _sweep([o._bounds for o in others], 1)
+            self._bounds = _merge(self._bounds, subtracted, _sub)
+
+    def symmetric_difference_update(self, other: NumpySchedule) -> NumpySchedule:
+        self._bounds = _merge(self._bounds, other._bounds, np.logical_xor)
+        return self
+
+    def __ixor__(self, other: NumpySchedule) -> NumpySchedule:
+        return self.symmetric_difference_update(other)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("NumpySchedule requires numpy")
+
+
+def _sub(inside_a, inside_b):
+    return inside_a & ~inside_b
+
+
+def _coalesce(starts, ends):
+    """Sort ranges and merge any that overlap or touch into a boundary array"""
+    if not len(starts):
+        return np.empty(0, dtype=np.int64)
+    order = np.argsort(starts, kind="stable")
+    starts = starts[order]
+    ends = np.maximum.accumulate(ends[order])
+    # A new range begins wherever a start lies beyond every end seen so far
+    first = np.concatenate(([True], starts[1:] > ends[:-1]))
+    last = np.concatenate((first[1:], [True]))
+    bounds = np.empty(2 * int(first.sum()), dtype=np.int64)
+    bounds[::2] = starts[first]
+    bounds[1::2] = ends[last]
+    return bounds
+
+
+def _changes(points, covered):
+    """Boundaries where coverage at each point differs from the point before"""
+    if not len(points):
+        return points
+    previous = np.concatenate(([False], covered[:-1]))
+    return points[covered != previous]
+
+
+def _merge(bounds_a, bounds_b, op: Callable):
+    """Combine two boundary arrays with a boolean operation on their coverage"""
+    points = np.union1d(bounds_a, bounds_b)
+    inside_a = np.searchsorted(bounds_a, points, side="right") % 2 == 1
+    inside_b = np.searchsorted(bounds_b, points, side="right") % 2 == 1
+    return _changes(points, op(inside_a, inside_b))
+
+
+def _sweep(bounds_lists: Sequence, minimum: int):
+    """Boundaries of the time covered by at least `minimum` of the boundary arrays"""
+    points = np.concatenate(bounds_lists)
+    if not len(points):
+        return points
+    deltas = np.ones(len(points), dtype=np.int64)
+    deltas[np.concatenate([np.arange(len(b)) % 2 == 1 for b in bounds_lists])] = -1
+    order = np.argsort(points, kind="stable")
+    points = points[order]
+    counts = np.cumsum(deltas[order])
+    # Coverage after a point is the running count at its last occurrence
+    last = np.concatenate((points[1:] != points[:-1], [True]))
+    return _changes(points[last], counts[last] >= minimum)
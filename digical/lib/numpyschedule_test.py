@@ -0,0 +1,174 @@
+import pytest
+
+from digical import Time, TimeRange, Schedule, NumpySchedule
+
+np = pytest.importorskip("numpy")
+
+
+def test_init():
+    """NumpySchedule() -> NumpySchedule"""
+    schedule_empty = NumpySchedule()
+    assert len(schedule_empty) == 0
+    schedule = NumpySchedule([
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2000), Time(2200))
+    ])
+    assert schedule.timeranges == (
+        TimeRange(Time(1000), Time(2200)),
+        TimeRange(Time(2500), Time(3000))
+    )
+
+
+def test_from_arrays():
+    """NumpySchedule.from_arrays(array, array) -> NumpySchedule"""
+    schedule = NumpySchedule.from_arrays(
+        np.array([2500, 1000, 1500]),
+        np.array([3000, 2000, 2500])
+    )
+    assert schedule.timeranges == (
+        TimeRange(Time(1000), Time(3000)),
+    )
+    assert schedule.starts.tolist() == [1000]
+    assert schedule.ends.tolist() == [3000]
+    with pytest.raises(ValueError):
+        NumpySchedule.from_arrays([1000], [1000])
+
+
+def test_from_schedule():
+    """NumpySchedule.from_schedule(Schedule) -> NumpySchedule"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    numpy_schedule = NumpySchedule.from_schedule(schedule)
+    assert numpy_schedule.timeranges == schedule.timeranges
+    assert numpy_schedule.to_schedule() == schedule
+
+
+def test_len():
+    """len(NumpySchedule) -> int"""
+    schedule = NumpySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert len(schedule) == 1500
+    assert isinstance(len(schedule), int)
+
+
+def test_contains():
+    """Time in NumpySchedule -> bool"""
+    """TimeRange in NumpySchedule -> bool"""
+    schedule = NumpySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert (Time(500) in schedule) is False
+    assert (Time(1000) in schedule) is True
+    assert (Time(2000) in schedule) is False
+    assert (Time(2750) in schedule) is True
+    assert (TimeRange(Time(1200), Time(1800)) in schedule) is True
+    assert (TimeRange(Time(1200), Time(2800)) in schedule) is False
+
+
+def test_contains_many():
+    """NumpySchedule.contains_many(array) -> bool array"""
+    schedule = NumpySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    times = np.array([500, 1000, 1500, 2000, 2250, 2500, 3000])
+    assert schedule.contains_many(times).tolist() == [False, True, True, False, False, True, False]
+    assert schedule.contains_many([Time(1000), Time(2000)]).tolist() == [True, False]
+
+
+def test_measure_many():
+    """NumpySchedule.measure_many(*TimeRange) -> int array"""
+    schedule = NumpySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert schedule.measure_many([
+        TimeRange(Time(1500), Time(2700)),
+        TimeRange(Time(0), Time(5000)),
+        TimeRange(Time(2000), Time(2500))
+    ]).tolist() == [700, 1500, 0]
+    assert NumpySchedule().measure_many([TimeRange(Time(0), Time(100))]).tolist() == [0]
+
+
+def test_add_discard():
+    """NumpySchedule.add(TimeRange) -> None"""
+    """NumpySchedule.discard(TimeRange) -> None"""
+    schedule = NumpySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule.add(TimeRange(Time(2000), Time(2500)))
+    assert schedule == NumpySchedule([
+        TimeRange(Time(1000), Time(3000))
+    ])
+    schedule.discard(TimeRange(Time(1500), Time(1600)))
+    assert schedule == NumpySchedule([
+        TimeRange(Time(1000), Time(1500)),
+        TimeRange(Time(1600), Time(3000))
+    ])
+    with pytest.raises(KeyError):
+        schedule.remove(TimeRange(Time(1400), Time(1700)))
+    assert schedule.pop() == TimeRange(Time(1600), Time(3000))
+
+
+def test_set_operations():
+    """NumpySchedule | & - ^ NumpySchedule -> NumpySchedule"""
+    schedule_a = NumpySchedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule_b = NumpySchedule([
+        TimeRange(Time(1200), Time(2200)),
+        TimeRange(Time(2700), Time(3200))
+    ])
+    schedule_c = NumpySchedule([
+        TimeRange(Time(1300), Time(6000))
+    ])
+    assert schedule_a | schedule_b == NumpySchedule([
+        TimeRange(Time(1000), Time(2200)),
+        TimeRange(Time(2500), Time(3200))
+    ])
+    assert schedule_a & schedule_b == NumpySchedule([
+        TimeRange(Time(1200), Time(2000)),
+        TimeRange(Time(2700), Time(3000))
+    ])
+    assert schedule_a - schedule_b == NumpySchedule([
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(2500), Time(2700))
+    ])
+    assert schedule_a ^ schedule_b == NumpySchedule([
+        TimeRange(Time(1000), Time(1200)),
+        TimeRange(Time(2000), Time(2200)),
+        TimeRange(Time(2500), Time(2700)),
+        TimeRange(Time(3000), Time(3200))
+    ])
+    assert schedule_a.intersection(schedule_b, schedule_c) == NumpySchedule([
+        TimeRange(Time(1300), Time(2000)),
+        TimeRange(Time(2700), Time(3000))
+    ])
+    assert schedule_a.union(schedule_b, schedule_c, NumpySchedule()) == NumpySchedule([
+        TimeRange(Time(1000), Time(6000))
+    ])
+    assert schedule_a.isdisjoint(schedule_b) is False
+    assert schedule_a.isdisjoint(schedule_a - schedule_a) is True
+
+
+def test_matches_schedule():
+    """NumpySchedule behaves like Schedule"""
+    timeranges_a = [TimeRange(Time(i * 70), Time(i * 70 + 40)) for i in range(50)]
+    timeranges_b = [TimeRange(Time(i * 110), Time(i * 110 + 90)) for i in range(30)]
+    schedule_a = Schedule(timeranges_a)
+    schedule_b = Schedule(timeranges_b)
+    numpy_a = NumpySchedule(timeranges_a)
+    numpy_b = NumpySchedule(timeranges_b)
+    assert (numpy_a | numpy_b).timeranges == (schedule_a | schedule_b).timeranges
+    assert (numpy_a & numpy_b).timeranges == (schedule_a & schedule_b).timeranges
+    assert (numpy_a - numpy_b).timeranges == (schedule_a - schedule_b).timeranges
+    assert (numpy_a ^ numpy_b).timeranges == (schedule_a ^ schedule_b).timeranges
+    assert len(numpy_a) == len(schedule_a)
@@ -0,0 +1,244 @@
+from __future__ import annotations
+from math import gcd
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+
+from .time import MINUTES_PER_WEEK
+from .timerange import Time, TimeRange
+from .schedule import Schedule, _BaseSchedule
+
+
+class RecurringSchedule:
+    """
+    A Schedule that repeats every `period` minutes (a week by default).
+    Only one period is stored, as ranges within [0, period); a range that
+    wraps past the end of the period is kept as two pieces.
+    """
+    __slots__ = ("_period", "_schedule")
+
+    def __init__(self, timeranges=(), period: int = MINUTES_PER_WEEK):
+        """RecurringSchedule() -> RecurringSchedule"""
+        if period <= 0:
+            raise ValueError("Invalid RecurringSchedule: period must be positive")
+        self._period = period
+        self._schedule = Schedule(_fold(timeranges, period))
+
+    @classmethod
+    def _from_schedule(cls, schedule: Schedule, period: int) -> RecurringSchedule:
+        recurring = cls.__new__(cls)
+        recurring._period = period
+        recurring._schedule = schedule
+        return recurring
+
+    @classmethod
+    def from_json(cls, j):
+        """RecurringSchedule.from_json(dict) -> RecurringSchedule"""
+        timeranges = [TimeRange.from_json(r) for r in j["timeranges"]]
+        return cls(timeranges, j["period"])
+
+    def to_json(self):
+        """RecurringSchedule.to_json() -> dict"""
+        return {
+            "period": self._period,
+            "timeranges": [TimeRange.to_json(r) for r in self.timeranges]
+        }
+
+    def copy(self) -> RecurringSchedule:
+        """RecurringSchedule.copy() -> RecurringSchedule"""
+        return self._from_schedule(self._schedule.copy(), self._period)
+
+    def __repr__(self) -> str:
+        """repr(RecurringSchedule) -> repr"""
+        return f"RecurringSchedule({list(self.timeranges)!r}, period={self._period})"
+
+    def __str__(self) -> str:
+        """str(RecurringSchedule) -> str"""
+        return "; ".join(str(r) for r in self.timeranges)
+
+    def __len__(self):
+        """len(RecurringSchedule) -> int"""
+        return len(self._schedule)
+
+    @property
+    def period(self) -> int:
+        """RecurringSchedule.period -> int"""
+        return self._period
+
+    @property
+    def timeranges(self):
+        """RecurringSchedule.timeranges -> *TimeRange"""
+        return self._schedule.timeranges
+
+    def __eq__(self, other: RecurringSchedule) -> bool:
+        """RecurringSchedule == RecurringSchedule -> bool"""
+        if isinstance(other, RecurringSchedule):
+            return self._period == other._period and self._schedule == other._schedule
+        else:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other: int) -> RecurringSchedule:
+        """RecurringSchedule + int -> RecurringSchedule"""
+        if isinstance(other, int):
+            return RecurringSchedule((r + other for r in self.timeranges), self._period)
+        else:
+            return NotImplemented
+
+    def __radd__(self, other: int) -> RecurringSchedule:
+        """int + RecurringSchedule -> RecurringSchedule"""
+        return self.__add__(other)
+
+    def __contains__(self, other: Union[Time, TimeRange]) -> bool:
+        """Time in RecurringSchedule -> bool"""
+        """TimeRange in RecurringSchedule -> bool"""
+        if isinstance(other, Time):
+            return Time(other.value % self._period) in self._schedule
+        if isinstance(other, TimeRange):
+            return all(r in self._schedule for r in _fold((other, ), self._period))
+        else:
+            return NotImplemented
+
+    def add(self, timerange: TimeRange) -> None:
+        for r in _fold((timerange, ), self._period):
+            self._schedule.add(r)
+
+    def remove(self, timerange: TimeRange) -> None:
+        if timerange not in self:
+            raise KeyError
+        self.discard(timerange)
+
+    def discard(self, timerange: TimeRange) -> None:
+        for r in _fold((timerange, ), self._period):
+            self._schedule.discard(r)
+
+    def expand(self, start: Time, end: Time) -> Schedule:
+        """RecurringSchedule.expand(Time, Time) -> Schedule"""
+        if start >= end:
+            return Schedule()
+        first = start.value // self._period
+        last = (end.value - 1) // self._period
+        timeranges = [
+            r + k * self._period
+            for k in range(first, last + 1)
+            for r in self._schedule.timeranges
+        ]
+        schedule = Schedule.from_ranges(timeranges)
+        schedule &= Schedule([TimeRange(start, end)])
+        return schedule
+
+    def _measure_before(self, time: Time) -> int:
+        """Minutes covered before `time`, counting whole periods from 0"""
+        periods, offset = divmod(time.value, self._period)
+        return periods * len(self._schedule) + self._schedule._measure_before(Time(offset))
+
+    def measure(self, start: Time, end: Time) -> int:
+        """RecurringSchedule.measure(Time, Time) -> int"""
+        if start >= end:
+            return 0
+        return self._measure_before(end) - self._measure_before(start)
+
+    def select(self, k: int) -> Time:
+        """RecurringSchedule.select(int) -> Time"""
+        if not self._schedule:
+            raise IndexError("RecurringSchedule.select from an empty schedule")
+        periods, k = divmod(k, len(self._schedule))
+        return self._schedule.select(k) + periods * self._period
+
+    def advance(self, time: Time, minutes: int) -> Time:
+        """RecurringSchedule.advance(Time, int) -> Time"""
+        if minutes < 0:
+            raise ValueError("Invalid advance: minutes must not be negative")
+        if not minutes:
+            return time
+        if not self._schedule:
+            raise ValueError("RecurringSchedule does not cover enough time to advance")
+        return self.select(self._measure_before(time) + minutes - 1) + 1
+
+    def union(self, *others: RecurringSchedule) -> RecurringSchedule:
+        period, schedule, schedules = self._align(others)
+        return self._from_schedule(schedule.union(*schedules), period)
+
+    def __or__(self, other: RecurringSchedule) -> RecurringSchedule:
+        if not isinstance(other, RecurringSchedule):
+            return NotImplemented
+        return self.union(other)
+
+    def intersection(self, *others: RecurringSchedule) -> RecurringSchedule:
+        period, schedule, schedules = self._align(others)
+        return self._from_schedule(schedule.intersection(*schedules), period)
+
+    def __and__(self, other: Union[RecurringSchedule, _BaseSchedule]):
+        """RecurringSchedule & RecurringSchedule -> RecurringSchedule"""
+        """RecurringSchedule & Schedule -> Schedule"""
+        if isinstance(other, RecurringSchedule):
+            return self.intersection(other)
+        if isinstance(other, _BaseSchedule):
+            return other.intersection(self._expand_over(other))
+        else:
+            return NotImplemented
+
+    def __rand__(self, other: _BaseSchedule):
+        """Schedule & RecurringSchedule -> Schedule"""
+        return self.__and__(other)
+
+    def difference(self, *others: RecurringSchedule) -> RecurringSchedule:
+        period, schedule, schedules = self._align(others)
+        return self._from_schedule(schedule.difference(*schedules), period)
+
+    def __sub__(self, other: RecurringSchedule) -> RecurringSchedule:
+        """RecurringSchedule - RecurringSchedule -> RecurringSchedule"""
+        if isinstance(other, int):
+            return self.__add__(-other)
+        if isinstance(other, RecurringSchedule):
+            return self.difference(other)
+        else:
+            return NotImplemented
+
+    def __rsub__(self, other: _BaseSchedule):
+        """Schedule - RecurringSchedule -> Schedule"""
+        if isinstance(other, _BaseSchedule):
+            return other.difference(self._expand_over(other))
+        else:
+            return NotImplemented
+
+    def symmetric_difference(self, other: RecurringSchedule) -> RecurringSchedule:
+        period, schedule, schedules = self._align((other, ))
+        return self._from_schedule(schedule.symmetric_difference(*schedules), period)
+
+    def __xor__(self, other: RecurringSchedule) -> RecurringSchedule:
+        if not isinstance(other, RecurringSchedule):
+            return NotImplemented
+        return self.symmetric_difference(other)
+
+    def _expand_over(self, schedule: _BaseSchedule) -> Schedule:
+        """Expand over the span of a concrete schedule"""
+        if not schedule.timeranges:
+            return Schedule()
+        return self.expand(schedule.timeranges[0].start, schedule.timeranges[-1].end)
+
+    def _align(self, others: Sequence[RecurringSchedule]) -> Tuple[int, Schedule, List[Schedule]]:
+        """Bring this and other recurring schedules to a common period"""
+        period = self._period
+        for other in others:
+            period = period * other._period // gcd(period, other._period)
+        return period, self._repeat(period), [o._repeat(period) for o in others]
+
+    def _repeat(self, period: int) -> Schedule:
+        if period == self._period:
+            return self._schedule
+        return self.expand(Time(0), Time(period))
+
+
+def _fold(timeranges: Iterable[TimeRange], period: int) -> Iterator[TimeRange]:
+    """Map ranges onto [0, period), splitting any that wrap around"""
+    for r in timeranges:
+        if len(r) >= period:
+            yield TimeRange(Time(0), Time(period))
+            continue
+        start = r.start.value % period
+        end = start + len(r)
+        if end <= period:
+            yield TimeRange(Time(start), Time(end))
+        else:
+            yield TimeRange(Time(start), Time(period))
+            yield TimeRange(Time(0), Time(end - period))
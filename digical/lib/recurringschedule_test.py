@@ -0,0 +1,175 @@
+import pytest
+
+from digical import Time, TimeRange, Schedule, RecurringSchedule
+
+
+def test_init():
+    """RecurringSchedule() -> RecurringSchedule"""
+    schedule = RecurringSchedule([
+        TimeRange(Time.from_dhm(1, 9, 0), Time.from_dhm(1, 17, 0)),
+        TimeRange(Time.from_dhm(9, 9, 0), Time.from_dhm(9, 17, 0))
+    ])
+    assert schedule.period == 10080
+    assert schedule.timeranges == (
+        TimeRange(Time.from_dhm(1, 9, 0), Time.from_dhm(1, 17, 0)),
+        TimeRange(Time.from_dhm(2, 9, 0), Time.from_dhm(2, 17, 0))
+    )
+    with pytest.raises(ValueError):
+        RecurringSchedule(period=0)
+
+
+def test_wrap_around():
+    """RecurringSchedule() -> RecurringSchedule"""
+    schedule = RecurringSchedule([
+        TimeRange(Time.from_dhm(6, 22, 0), Time.from_dhm(7, 2, 0))
+    ])
+    assert schedule.timeranges == (
+        TimeRange(Time.from_dhm(0, 0, 0), Time.from_dhm(0, 2, 0)),
+        TimeRange(Time.from_dhm(6, 22, 0), Time.from_dhm(7, 0, 0))
+    )
+    assert len(schedule) == 240
+    assert Time.from_dhm(6, 23, 0) in schedule
+    assert Time.from_dhm(14, 1, 0) in schedule
+    assert Time.from_dhm(14, 2, 0) not in schedule
+    assert TimeRange(Time.from_dhm(13, 23, 0), Time.from_dhm(14, 1, 0)) in schedule
+    assert TimeRange(Time.from_dhm(13, 21, 0), Time.from_dhm(14, 1, 0)) not in schedule
+
+
+def test_expand():
+    """RecurringSchedule.expand(Time, Time) -> Schedule"""
+    schedule = RecurringSchedule([
+        TimeRange(Time.from_dhm(6, 22, 0), Time.from_dhm(7, 2, 0)),
+        TimeRange(Time.from_dhm(3, 9, 0), Time.from_dhm(3, 17, 0))
+    ])
+    expanded = schedule.expand(Time.from_dhm(3, 12, 0), Time.from_dhm(14, 1, 0))
+    assert expanded == Schedule([
+        TimeRange(Time.from_dhm(3, 12, 0), Time.from_dhm(3, 17, 0)),
+        TimeRange(Time.from_dhm(6, 22, 0), Time.from_dhm(7, 2, 0)),
+        TimeRange(Time.from_dhm(10, 9, 0), Time.from_dhm(10, 17, 0)),
+        TimeRange(Time.from_dhm(13, 22, 0), Time.from_dhm(14, 1, 0))
+    ])
+    assert schedule.expand(Time(100), Time(100)) == Schedule()
+
+
+def test_add_discard():
+    """RecurringSchedule.add(TimeRange) -> None"""
+    """RecurringSchedule.discard(TimeRange) -> None"""
+    schedule = RecurringSchedule(period=100)
+    schedule.add(TimeRange(Time(190), Time(230)))
+    assert schedule.timeranges == (
+        TimeRange(Time(0), Time(30)),
+        TimeRange(Time(90), Time(100))
+    )
+    schedule.discard(TimeRange(Time(10), Time(20)))
+    assert schedule.timeranges == (
+        TimeRange(Time(0), Time(10)),
+        TimeRange(Time(20), Time(30)),
+        TimeRange(Time(90), Time(100))
+    )
+    with pytest.raises(KeyError):
+        schedule.remove(TimeRange(Time(5), Time(15)))
+    schedule.add(TimeRange(Time(0), Time(500)))
+    assert len(schedule) == 100
+
+
+def test_set_operations():
+    """RecurringSchedule | & - ^ RecurringSchedule -> RecurringSchedule"""
+    schedule_a = RecurringSchedule([TimeRange(Time(0), Time(50))], period=100)
+    schedule_b = RecurringSchedule([TimeRange(Time(25), Time(75))], period=100)
+    assert schedule_a | schedule_b == RecurringSchedule([TimeRange(Time(0), Time(75))], period=100)
+    assert schedule_a & schedule_b == RecurringSchedule([TimeRange(Time(25), Time(50))], period=100)
+    assert schedule_a - schedule_b == RecurringSchedule([TimeRange(Time(0), Time(25))], period=100)
+    assert schedule_a ^ schedule_b == RecurringSchedule([
+        TimeRange(Time(0), Time(25)),
+        TimeRange(Time(50), Time(75))
+    ], period=100)
+
+
+def test_set_operations_period():
+    """RecurringSchedule & RecurringSchedule -> RecurringSchedule"""
+    schedule_a = RecurringSchedule([TimeRange(Time(0), Time(50))], period=100)
+    schedule_b = RecurringSchedule([TimeRange(Time(0), Time(100))], period=150)
+    intersected = schedule_a & schedule_b
+    assert intersected.period == 300
+    assert intersected == RecurringSchedule([
+        TimeRange(Time(0), Time(50)),
+        TimeRange(Time(200), Time(250))
+    ], period=300)
+    assert Time(220) in intersected
+    assert Time(120) not in intersected
+
+
+def test_concrete():
+    """RecurringSchedule & Schedule -> Schedule"""
+    """Schedule - RecurringSchedule -> Schedule"""
+    recurring = RecurringSchedule([TimeRange(Time(0), Time(50))], period=100)
+    schedule = Schedule([TimeRange(Time(1030), Time(1260))])
+    assert recurring & schedule == Schedule([
+        TimeRange(Time(1030), Time(1050)),
+        TimeRange(Time(1100), Time(1150)),
+        TimeRange(Time(1200), Time(1250))
+    ])
+    assert schedule & recurring == recurring & schedule
+    assert schedule - recurring == Schedule([
+        TimeRange(Time(1050), Time(1100)),
+        TimeRange(Time(1150), Time(1200)),
+        TimeRange(Time(1250), Time(1260))
+    ])
+    assert recurring & Schedule() == Schedule()
+    with pytest.raises(TypeError):
+        recurring | schedule
+
+
+def test_shift():
+    """RecurringSchedule + int -> RecurringSchedule"""
+    schedule = RecurringSchedule([TimeRange(Time(60), Time(90))], period=100)
+    assert schedule + 20 == RecurringSchedule([
+        TimeRange(Time(0), Time(10)),
+        TimeRange(Time(80), Time(100))
+    ], period=100)
+    assert schedule - 60 == RecurringSchedule([TimeRange(Time(0), Time(30))], period=100)
+
+
+def test_json():
+    """RecurringSchedule.from_json(dict) -> RecurringSchedule"""
+    """RecurringSchedule.to_json() -> dict"""
+    schedule = RecurringSchedule([TimeRange(Time(60), Time(90))], period=100)
+    assert schedule.to_json() == {
+        "period": 100,
+        "timeranges": [
+            {
+                "start": {"value": 60},
+                "end": {"value": 90}
+            }
+        ]
+    }
+    assert RecurringSchedule.from_json(schedule.to_json()) == schedule
+
+
+def test_measure():
+    """RecurringSchedule.measure(Time, Time) -> int"""
+    schedule = RecurringSchedule([
+        TimeRange(Time(100), Time(200))
+    ], period=1000)
+    assert schedule.measure(Time(0), Time(1000)) == 100
+    assert schedule.measure(Time(150), Time(3150)) == 300
+    assert schedule.measure(Time(-1000), Time(0)) == 100
+    assert schedule.measure(Time(500), Time(100)) == 0
+
+
+def test_select_advance():
+    """RecurringSchedule.select(int) -> Time"""
+    """RecurringSchedule.advance(Time, int) -> Time"""
+    schedule = RecurringSchedule([
+        TimeRange(Time(100), Time(200))
+    ], period=1000)
+    assert schedule.select(0) == Time(100)
+    assert schedule.select(150) == Time(1150)
+    assert schedule.advance(Time(150), 50) == Time(200)
+    assert schedule.advance(Time(150), 51) == Time(1101)
+    assert schedule.advance(Time(500), 1000) == Time(10200)
+    assert schedule.advance(Time(500), 0) == Time(500)
+    with pytest.raises(ValueError):
+        schedule.advance(Time(500), -1)
+    with pytest.raises(ValueError):
+        RecurringSchedule(period=1000).advance(Time(0), 1)
@@ -1,22 +1,145 @@
 from __future__ import annotations
-from typing import List, Tuple, Union
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from collections.abc import Sequence as SequenceABC
 import bisect
+import heapq
+import itertools
 
 from .timerange import Time, TimeRange
+from .maxtree import MaxTree
 
 
-class Schedule:
+class TimeRangesView(SequenceABC):
+    """
+    A read-only, live view of the ranges in a Schedule, in order.
+    Slicing returns a tuple of the selected ranges.
+    """
+    __slots__ = ("_schedule", )
+
+    def __init__(self, schedule: _BaseSchedule):
+        self._schedule = schedule
+
+    def __len__(self) -> int:
+        return len(self._schedule._timeranges)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._schedule._timeranges[index])
+        return self._schedule._timeranges[index]
+
+    def __iter__(self) -> Iterator[TimeRange]:
+        return self._checked(iter(self._schedule._timeranges))
+
+    def __reversed__(self) -> Iterator[TimeRange]:
+        return self._checked(reversed(self._schedule._timeranges))
+
+    def _checked(self, timeranges: Iterator[TimeRange]) -> Iterator[TimeRange]:
+        """Iterate, raising if the schedule is modified, the way dict views do"""
+        schedule = self._schedule
+        version = schedule._version
+        for timerange in timeranges:
+            yield timerange
+            if schedule._version != version:
+                raise RuntimeError("Schedule changed during iteration")
+
+    def __contains__(self, timerange: TimeRange) -> bool:
+        if not isinstance(timerange, TimeRange):
+            return False
+        timeranges = self._schedule._timeranges
+        i = bisect.bisect_left(timeranges, timerange)
+        return i < len(timeranges) and timeranges[i] == timerange
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TimeRangesView):
+            return self._schedule._timeranges == other._schedule._timeranges
+        if isinstance(other, (tuple, list)):
+            timeranges = self._schedule._timeranges
+            return len(timeranges) == len(other) and all(a == b for a, b in zip(timeranges, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"TimeRangesView({self._schedule._timeranges!r})"
+
+
+class _BaseSchedule:
+    """Read-only operations shared by Schedule and FrozenSchedule"""
+    __slots__ = ("_timeranges", "_length", "_gaps", "_cumulative", "_version")
+
     def __init__(self, timeranges=()):
-        """Schedule() -> Schedule"""
-        self._timeranges: List[TimeRange] = []
-        for r in timeranges:
-            self.add(r)
+        self._version = 0
+        self._set(_coalesce(timeranges))
+
+    @classmethod
+    def from_ranges(cls, timeranges: Iterable[TimeRange], normalized: bool = False):
+        """
+        Schedule.from_ranges(*TimeRange) -> Schedule
+        Schedule.from_ranges(*TimeRange, normalized=True) -> Schedule
+
+        With normalized=True the ranges are trusted to already be sorted,
+        disjoint and non-adjacent, and are used as-is.
+        """
+        schedule = cls()
+        if normalized:
+            schedule._set(list(timeranges))
+        else:
+            schedule._set(_coalesce(timeranges))
+        return schedule
+
+    def _set(self, timeranges: List[TimeRange]) -> None:
+        self._timeranges = timeranges
+        self._length = sum(len(r) for r in timeranges)
+        self._version += 1
+        self._gaps = None
+        self._cumulative = None
+
+    def _replace(self, i: int, j: int, timeranges: Sequence[TimeRange]) -> None:
+        """Replace the ranges in the window [i, j), keeping the total length current"""
+        removed = sum(len(r) for r in self._timeranges[i:j])
+        self._length += sum(len(r) for r in timeranges) - removed
+        count = len(self._timeranges)
+        self._timeranges[i:j] = timeranges
+        self._version += 1
+        self._cumulative = None
+        if self._gaps is not None:
+            # Gap k lies between ranges k and k + 1, so the gaps touching the
+            # window are replaced by those around the new ranges
+            low = max(i - 1, 0)
+            for _ in range(low, min(j, count - 1)):
+                del self._gaps[low]
+            for k in range(low, min(i + len(timeranges), len(self._timeranges) - 1)):
+                self._gaps.insert(k, self._gap(k))
+
+    def _gap(self, k: int) -> int:
+        return self._timeranges[k + 1].start.value - self._timeranges[k].end.value
+
+    def _gap_tree(self) -> MaxTree:
+        """Lengths of the gaps between consecutive ranges, built on first use and kept current by _replace"""
+        if self._gaps is None:
+            self._gaps = MaxTree([self._gap(k) for k in range(len(self._timeranges) - 1)])
+        return self._gaps
+
+    def _cumulative_lengths(self) -> List[int]:
+        """Total length of the ranges before each index, built on first use"""
+        if self._cumulative is None:
+            self._cumulative = [0]
+            self._cumulative.extend(itertools.accumulate(len(r) for r in self._timeranges))
+        return self._cumulative
+
+    def _measure_before(self, time: Time) -> int:
+        """Minutes covered before `time`"""
+        i = bisect.bisect_left(self._timeranges, time)
+        covered = self._cumulative_lengths()[i]
+        if i < len(self._timeranges) and self._timeranges[i].start < time:
+            covered += time.value - self._timeranges[i].start.value
+        return covered
 
     @classmethod
     def from_json(cls, j):
         """Schedule.from_json(dict) -> Schedule"""
         timeranges = [TimeRange.from_json(r) for r in j["timeranges"]]
-        return cls(timeranges)
+        return cls.from_ranges(timeranges)
 
     def to_json(self):
         """Schedule.to_json() -> dict"""
@@ -24,13 +147,13 @@ class Schedule:
             "timeranges": [TimeRange.to_json(r) for r in self.timeranges]
         }
 
-    def copy(self) -> Schedule:
+    def copy(self):
         """Schedule.copy() -> Schedule"""
-        return Schedule(self._timeranges.copy())
+        return self.from_ranges(self._timeranges, normalized=True)
 
     def __repr__(self) -> str:
         """repr(Schedule) -> repr"""
-        return f"Schedule({self._timeranges!r})"
+        return f"{type(self).__name__}({self._timeranges!r})"
 
     def __str__(self) -> str:
         """str(Schedule) -> str"""
@@ -38,133 +161,234 @@ class Schedule:
 
     def __len__(self):
         """len(Schedule) -> int"""
-        return sum(len(r) for r in self._timeranges)
+        return self._length
 
     @property
-    def timeranges(self):
+    def timeranges(self) -> TimeRangesView:
         """Schedule.timeranges -> *TimeRange"""
-        return tuple(self._timeranges)
+        return TimeRangesView(self)
 
-    def __eq__(self, other: Schedule) -> bool:
+    def __eq__(self, other: _BaseSchedule) -> bool:
         """Schedule == Schedule -> bool"""
-        if isinstance(other, Schedule):
+        if isinstance(other, _BaseSchedule):
             return self._timeranges == other._timeranges
         else:
             return NotImplemented
 
-    def __add__(self, other: Union[int, Schedule]) -> Schedule:
+    def __add__(self, other: Union[int, _BaseSchedule]):
         """Schedule + int -> Schedule"""
         if isinstance(other, int):
             timeranges = [r + other for r in self._timeranges]
-            return Schedule(timeranges)
-        if isinstance(other, Schedule):
-            schedule = self.copy()
-            schedule += other
-            return schedule
+            return self.from_ranges(timeranges, normalized=True)
+        if isinstance(other, _BaseSchedule):
+            return self.union(other)
         else:
             return NotImplemented
 
-    def __sub__(self, other: Union[int, Schedule]) -> Schedule:
+    def __sub__(self, other: Union[int, _BaseSchedule]):
         """Schedule - int -> Schedule"""
         if isinstance(other, int):
             timeranges = [r - other for r in self._timeranges]
-            return Schedule(timeranges)
-        if isinstance(other, Schedule):
-            schedule = self.copy()
-            schedule -= other
-            return schedule
+            return self.from_ranges(timeranges, normalized=True)
+        if isinstance(other, _BaseSchedule):
+            return self.difference(other)
         else:
             return NotImplemented
 
-    def __radd__(self, other: int) -> int:
+    def __radd__(self, other: int):
         """int + Schedule -> Schedule"""
         if isinstance(other, int):
             return self.__add__(other)
         else:
             return NotImplemented
 
-    def __iadd__(self, other: Union[int, Schedule]) -> Schedule:
-        """Schedule += int -> None"""
-        if isinstance(other, int):
-            self._timeranges = [r + other for r in self._timeranges]
-            return self
-        if isinstance(other, Schedule):
-            for r in other.timeranges:
-                self.add(r)
-            return self
-        else:
-            return NotImplemented
-
-    def __isub__(self, other: Union[int, Schedule]) -> Schedule:
-        """Schedule - int -> Schedule"""
-        if isinstance(other, int):
-            self._timeranges = [r - other for r in self._timeranges]
-            return self
-        if isinstance(other, Schedule):
-            self.difference_update(other)
-            return self
-        else:
-            return NotImplemented
-
     def __contains__(self, other: Time) -> bool:
         """Time in Schedule -> bool"""
         if isinstance(other, Time):
-            return any(other in r for r in self._timeranges)
+            i = bisect.bisect_left(self._timeranges, other)
+            return i < len(self._timeranges) and self._timeranges[i].start <= other
         if isinstance(other, TimeRange):
-            return any(other in r for r in self._timeranges)
+            i = bisect.bisect_left(self._timeranges, other.start)
+            return i < len(self._timeranges) and other in self._timeranges[i]
         else:
             return NotImplemented
 
-    def add(self, timerange: TimeRange) -> None:
-        overlapping = []
-        for i, r in enumerate(self._timeranges):
-            if not timerange_isdisjoint(timerange, r) or timerange_isadjacent(timerange, r):
-                overlapping.append(i)
-
-        if not overlapping:
-            bisect.insort(self._timeranges, timerange)
-        elif len(overlapping) == 1:
-            i = overlapping[0]
-            timerange = timerange_union(timerange, self._timeranges[i])[0]
-            self._timeranges[i] = timerange
-        else:
-            i = overlapping[0]
-            j = overlapping[-1]
-            timerange = timerange_union(timerange, self._timeranges[i])[0]
-            timerange = timerange_union(timerange, self._timeranges[j])[0]
-            self._timeranges[i:j + 1] = (timerange, )
-
-    def remove(self, timerange: TimeRange) -> None:
-        if timerange not in self:
-            raise KeyError
-        self.discard(timerange)
-
-    def discard(self, timerange: TimeRange) -> None:
-        overlapping = []
-        for i, r in enumerate(self._timeranges):
-            if not timerange_isdisjoint(timerange, r):
-                overlapping.append(i)
-
-        if not overlapping:
+    def _overlapping(self, timerange: TimeRange) -> Tuple[int, int]:
+        """Schedule._overlapping(TimeRange) -> (int, int)"""
+        i = bisect.bisect_left(self._timeranges, timerange.start)
+        j = bisect.bisect_right(self._timeranges, timerange.end, i)
+        if j > i and self._timeranges[j - 1].start == timerange.end:
+            j -= 1
+        return i, j
+
+    def iter_between(self, start: Time, end: Time) -> Iterator[TimeRange]:
+        """Schedule.iter_between(Time, Time) -> *TimeRange"""
+        if start >= end:
             return
-        elif len(overlapping) == 1:
-            i = overlapping[0]
-            timeranges = timerange_difference(self._timeranges[i], timerange)
-            self._timeranges[i:i + 1] = timeranges
-        else:
-            i = overlapping[0]
-            j = overlapping[-1]
-            timeranges = timerange_difference(self._timeranges[i], timerange)
-            timeranges += timerange_difference(self._timeranges[j], timerange)
-            self._timeranges[i:j + 1] = timeranges
+        i, j = self._overlapping(TimeRange(start, end))
+        for k in range(i, j):
+            yield self._timeranges[k]
+
+    def slice(self, start: Time, end: Time):
+        """Schedule.slice(Time, Time) -> Schedule"""
+        if start >= end:
+            return self.from_ranges((), normalized=True)
+        i, j = self._overlapping(TimeRange(start, end))
+        timeranges = self._timeranges[i:j]
+        if timeranges and timeranges[0].start < start:
+            timeranges[0] = TimeRange(start, timeranges[0].end)
+        if timeranges and timeranges[-1].end > end:
+            timeranges[-1] = TimeRange(timeranges[-1].start, end)
+        return self.from_ranges(timeranges, normalized=True)
+
+    def measure(self, start: Time, end: Time) -> int:
+        """Schedule.measure(Time, Time) -> int"""
+        if start >= end:
+            return 0
+        return self._measure_before(end) - self._measure_before(start)
+
+    def contains_many(self, times: Iterable[Union[Time, int]]) -> List[bool]:
+        """Schedule.contains_many(*Time) -> [bool]"""
+        values = [t.value if isinstance(t, Time) else t for t in times]
+        contained = [False] * len(values)
+        timeranges = self._timeranges
+        i = 0
+        for k in _sorted_order(values):
+            value = values[k]
+            while i < len(timeranges) and timeranges[i].end.value <= value:
+                i += 1
+            contained[k] = i < len(timeranges) and timeranges[i].start.value <= value
+        return contained
+
+    def measure_many(self, timeranges: Iterable[TimeRange]) -> List[int]:
+        """Schedule.measure_many(*TimeRange) -> [int]"""
+        windows = list(timeranges)
+        values = [r.start.value for r in windows] + [r.end.value for r in windows]
+        covered = self._measure_before_many(values)
+        return [covered[len(windows) + k] - covered[k] for k in range(len(windows))]
+
+    def _measure_before_many(self, values: List[int]) -> List[int]:
+        """Minutes covered before each value, in one pass over the ranges"""
+        covered = [0] * len(values)
+        timeranges = self._timeranges
+        i = 0
+        total = 0
+        for k in _sorted_order(values):
+            value = values[k]
+            while i < len(timeranges) and timeranges[i].end.value <= value:
+                total += len(timeranges[i])
+                i += 1
+            covered[k] = total
+            if i < len(timeranges) and timeranges[i].start.value < value:
+                covered[k] += value - timeranges[i].start.value
+        return covered
+
+    def select(self, k: int) -> Time:
+        """Schedule.select(int) -> Time"""
+        if not 0 <= k < self._length:
+            raise IndexError("Schedule.select index out of range")
+        cumulative = self._cumulative_lengths()
+        i = bisect.bisect_right(cumulative, k) - 1
+        return self._timeranges[i].start + (k - cumulative[i])
+
+    def advance(self, time: Time, minutes: int) -> Time:
+        """Schedule.advance(Time, int) -> Time"""
+        if minutes < 0:
+            raise ValueError("Invalid advance: minutes must not be negative")
+        if not minutes:
+            return time
+        target = self._measure_before(time) + minutes
+        if target > self._length:
+            raise ValueError("Schedule does not cover enough time to advance")
+        return self.select(target - 1) + 1
+
+    def next_gap(self, after: Time, duration: int) -> Time:
+        """Schedule.next_gap(Time, int) -> Time"""
+        timeranges = self._timeranges
+        i = bisect.bisect_left(timeranges, after)
+        if i == len(timeranges):
+            return after
+        if timeranges[i].start > after and timeranges[i].start.value - after.value >= duration:
+            return after
+        k = self._gap_tree().first_at_least(i, duration)
+        if k < 0:
+            return timeranges[-1].end
+        return timeranges[k].end
+
+    def largest_gap(self, start: Time, end: Time) -> Optional[TimeRange]:
+        """Schedule.largest_gap(Time, Time) -> TimeRange"""
+        if start >= end:
+            return None
+        i, j = self._overlapping(TimeRange(start, end))
+        if i == j:
+            return TimeRange(start, end)
+        timeranges = self._timeranges
+        gaps = []
+        if timeranges[i].start > start:
+            gaps.append(TimeRange(start, timeranges[i].start))
+        k = self._gap_tree().argmax(i, j - 1)
+        if k >= 0:
+            gaps.append(TimeRange(timeranges[k].end, timeranges[k + 1].start))
+        if timeranges[j - 1].end < end:
+            gaps.append(TimeRange(timeranges[j - 1].end, end))
+        if not gaps:
+            return None
+        return max(gaps, key=len)
+
+    def complement(self, start: Time, end: Time):
+        """Schedule.complement(Time, Time) -> Schedule"""
+        if start >= end:
+            return self.from_ranges((), normalized=True)
+        i, j = self._overlapping(TimeRange(start, end))
+        timeranges = _difference([TimeRange(start, end)], self._timeranges[i:j])
+        return self.from_ranges(timeranges, normalized=True)
+
+    def _iter_after(self, time: Optional[Time]) -> Iterator[TimeRange]:
+        """Yield the ranges from `time` onwards, clipping one that contains it"""
+        if time is None:
+            yield from self._timeranges
+            return
+        i = bisect.bisect_left(self._timeranges, time)
+        if i < len(self._timeranges) and self._timeranges[i].start < time:
+            yield TimeRange(time, self._timeranges[i].end)
+            i += 1
+        for k in range(i, len(self._timeranges)):
+            yield self._timeranges[k]
+
+    @staticmethod
+    def iter_common_slots(schedules: Sequence[_BaseSchedule], duration: int, after: Optional[Time] = None) -> Iterator[TimeRange]:
+        """Schedule.iter_common_slots(*Schedule, int, Time) -> *TimeRange"""
+        if not schedules:
+            return
+        range_lists = [s._iter_after(after) for s in schedules]
+        for timerange in _iter_sweep(range_lists, len(range_lists)):
+            if len(timerange) >= duration:
+                yield timerange
 
-    def pop(self) -> TimeRange:
-        try:
-            return self._timeranges.pop()
-        except IndexError:
-            raise KeyError
+    @staticmethod
+    def find_common_slot(schedules: Sequence[_BaseSchedule], duration: int, after: Optional[Time] = None) -> Optional[TimeRange]:
+        """Schedule.find_common_slot(*Schedule, int, Time) -> TimeRange"""
+        return next(_BaseSchedule.iter_common_slots(schedules, duration, after), None)
 
-    def isdisjoint(self, other: Schedule) -> bool:
+    @staticmethod
+    def find_common_slots(schedules: Sequence[_BaseSchedule], duration: int, count: int, after: Optional[Time] = None) -> List[TimeRange]:
+        """Schedule.find_common_slots(*Schedule, int, int, Time) -> [TimeRange]"""
+        return list(itertools.islice(_BaseSchedule.iter_common_slots(schedules, duration, after), count))
+
+    @classmethod
+    def quorum(cls, schedules: Sequence[_BaseSchedule], k: int):
+        """Schedule.quorum(*Schedule, int) -> Schedule"""
+        if k <= 0:
+            raise ValueError("Invalid quorum: k must be positive")
+        timeranges = _sweep([s._timeranges for s in schedules], k)
+        return cls.from_ranges(timeranges, normalized=True)
+
+    @staticmethod
+    def coverage(schedules: Sequence[_BaseSchedule]) -> List[Tuple[TimeRange, int]]:
+        """Schedule.coverage(*Schedule) -> [(TimeRange, int)]"""
+        return list(_iter_coverage([s._timeranges for s in schedules]))
+
+    def isdisjoint(self, other: _BaseSchedule) -> bool:
         ranges_a = iter(self._timeranges)
         ranges_b = iter(other._timeranges)
         try:
@@ -180,7 +404,7 @@ class Schedule:
         except StopIteration:
             return True
 
-    def issubset(self, other: Schedule) -> bool:
+    def issubset(self, other: _BaseSchedule) -> bool:
         if not other._timeranges:
             return True
         ranges_a = iter(self._timeranges)
@@ -196,101 +420,303 @@ class Schedule:
             return False
         return True
 
-    def __le__(self, other: Schedule) -> bool:
+    def __le__(self, other: _BaseSchedule) -> bool:
         return other.issubset(self)
 
-    def __lt__(self, other: Schedule) -> bool:
+    def __lt__(self, other: _BaseSchedule) -> bool:
         if self == other:
             return False
         return other.issubset(self)
 
-    def issuperset(self, other: Schedule) -> bool:
+    def issuperset(self, other: _BaseSchedule) -> bool:
         return other.issubset(self)
 
-    def __ge__(self, other: Schedule) -> bool:
+    def __ge__(self, other: _BaseSchedule) -> bool:
         return other.issuperset(self)
 
-    def __gt__(self, other: Schedule) -> bool:
+    def __gt__(self, other: _BaseSchedule) -> bool:
         if self == other:
             return False
         return other.issuperset(self)
 
-    def union(self, *others: Schedule) -> Schedule:
-        schedule = self.copy()
-        schedule.update(*others)
-        return schedule
+    def union(self, *others: _BaseSchedule):
+        timeranges = _union([self._timeranges] + [o._timeranges for o in others])
+        return self.from_ranges(timeranges, normalized=True)
 
-    def __or__(self, other: Schedule) -> Schedule:
+    def __or__(self, other: _BaseSchedule):
+        if not isinstance(other, _BaseSchedule):
+            return NotImplemented
         return self.union(other)
 
-    def intersection(self, *others: Schedule) -> Schedule:
-        schedule = self.copy()
-        schedule.intersection_update(*others)
-        return schedule
+    def intersection(self, *others: _BaseSchedule):
+        timeranges = _intersection([self._timeranges] + [o._timeranges for o in others])
+        return self.from_ranges(timeranges, normalized=True)
 
-    def __and__(self, other: Schedule) -> Schedule:
+    def __and__(self, other: _BaseSchedule):
+        if not isinstance(other, _BaseSchedule):
+            return NotImplemented
         return self.intersection(other)
 
-    def difference(self, *others: Schedule) -> Schedule:
-        schedule = self.copy()
-        schedule.difference_update(*others)
-        return schedule
+    def difference(self, *others: _BaseSchedule):
+        timeranges = _difference_many(self._timeranges, [o._timeranges for o in others])
+        return self.from_ranges(timeranges, normalized=True)
 
-    def sub(self, other: Schedule) -> Schedule:
+    def sub(self, other: _BaseSchedule):
         return self.difference(other)
 
-    def symmetric_difference(self, other: Schedule) -> Schedule:
-        unioned = self.union(other)
-        intersectioned = self.intersection(other)
-        schedule = unioned - intersectioned
-        return schedule
+    def symmetric_difference(self, other: _BaseSchedule):
+        timeranges = _sweep([self._timeranges, other._timeranges], 1, 1)
+        return self.from_ranges(timeranges, normalized=True)
 
-    def __xor__(self, other: Schedule) -> Schedule:
+    def __xor__(self, other: _BaseSchedule):
+        if not isinstance(other, _BaseSchedule):
+            return NotImplemented
         return self.symmetric_difference(other)
 
-    def update(self, *others: Schedule) -> None:
-        for other in others:
-            for r in other._timeranges:
-                self.add(r)
 
-    def __ior__(self, other: Schedule) -> None:
+class Schedule(_BaseSchedule):
+    __slots__ = ()
+    __hash__ = None
+
+    def __init__(self, timeranges=()):
+        """Schedule() -> Schedule"""
+        super().__init__(timeranges)
+
+    def __iadd__(self, other: Union[int, _BaseSchedule]) -> Schedule:
+        """Schedule += int -> None"""
+        if isinstance(other, int):
+            self._timeranges = [r + other for r in self._timeranges]
+            self._version += 1
+            return self
+        if isinstance(other, _BaseSchedule):
+            self.update(other)
+            return self
+        else:
+            return NotImplemented
+
+    def __isub__(self, other: Union[int, _BaseSchedule]) -> Schedule:
+        """Schedule - int -> Schedule"""
+        if isinstance(other, int):
+            self._timeranges = [r - other for r in self._timeranges]
+            self._version += 1
+            return self
+        if isinstance(other, _BaseSchedule):
+            self.difference_update(other)
+            return self
+        else:
+            return NotImplemented
+
+    def add(self, timerange: TimeRange) -> None:
+        # Ranges are kept sorted and disjoint, so the ranges touching the new
+        # one form a single contiguous window that can be found by bisection
+        i = bisect.bisect_left(self._timeranges, timerange.start)
+        if i and self._timeranges[i - 1].end == timerange.start:
+            i -= 1
+        j = bisect.bisect_right(self._timeranges, timerange.end, i)
+
+        if i == j:
+            self._replace(i, i, (timerange, ))
+            return
+        start = min(timerange.start, self._timeranges[i].start)
+        end = max(timerange.end, self._timeranges[j - 1].end)
+        if start != timerange.start or end != timerange.end:
+            timerange = TimeRange(start, end)
+        self._replace(i, j, (timerange, ))
+
+    def remove(self, timerange: TimeRange) -> None:
+        i, j = self._overlapping(timerange)
+        if j - i != 1 or timerange not in self._timeranges[i]:
+            raise KeyError
+        self._replace(i, j, timerange_difference(self._timeranges[i], timerange))
+
+    def discard(self, timerange: TimeRange) -> None:
+        i, j = self._overlapping(timerange)
+        if i == j:
+            return
+        timeranges = timerange_difference(self._timeranges[i], timerange)
+        if j - i > 1:
+            timeranges += timerange_difference(self._timeranges[j - 1], timerange)
+        self._replace(i, j, timeranges)
+
+    def pop(self) -> TimeRange:
+        try:
+            timerange = self._timeranges.pop()
+        except IndexError:
+            raise KeyError
+        self._length -= len(timerange)
+        self._version += 1
+        if self._gaps:
+            del self._gaps[len(self._gaps) - 1]
+        if self._cumulative is not None:
+            self._cumulative.pop()
+        return timerange
+
+    def update(self, *others: _BaseSchedule) -> None:
+        self._set(_union([self._timeranges] + [o._timeranges for o in others]))
+
+    def __ior__(self, other: _BaseSchedule) -> Schedule:
+        if not isinstance(other, _BaseSchedule):
+            return NotImplemented
         self.update(other)
         return self
 
-    def intersection_update(self, *others: Schedule) -> None:
-        if any(not o._timeranges for o in others):
-            self._timeranges.clear()
-            return
+    def intersection_update(self, *others: _BaseSchedule) -> None:
+        self._set(_intersection([self._timeranges] + [o._timeranges for o in others]))
 
-        for other in others:
-            new_ranges = []
-            other_iter = iter(other._timeranges)
-            other_r = next(other_iter)
-            for r in self._timeranges:
-                for other_r in other.timeranges:
-                    new_ranges.extend(timerange_intersection(r, other_r))
-            self._timeranges = new_ranges
-            if not self._timeranges:
-                return
-
-    def __iand__(self, other: Schedule) -> None:
+    def __iand__(self, other: _BaseSchedule) -> Schedule:
+        if not isinstance(other, _BaseSchedule):
+            return NotImplemented
         self.intersection_update(other)
         return self
 
-    def difference_update(self, *others: Schedule) -> None:
-        for other in others:
-            for r in other._timeranges:
-                self.discard(r)
+    def difference_update(self, *others: _BaseSchedule) -> None:
+        self._set(_difference_many(self._timeranges, [o._timeranges for o in others]))
 
-    def symmetric_difference_update(self, other: Schedule) -> Schedule:
-        schedule = self.symmetric_difference(other)
-        self._timeranges = schedule._timeranges
+    def symmetric_difference_update(self, other: _BaseSchedule) -> Schedule:
+        self._set(_sweep([self._timeranges, other._timeranges], 1, 1))
         return self
 
-    def __ixor__(self, other: Schedule) -> Schedule:
+    def __ixor__(self, other: _BaseSchedule) -> Schedule:
+        if not isinstance(other, _BaseSchedule):
+            return NotImplemented
         return self.symmetric_difference_update(other)
 
 
+def _coalesce(timeranges: Iterable[TimeRange]) -> List[TimeRange]:
+    """Sort ranges and merge any that overlap or touch"""
+    coalesced = []
+    for r in sorted(timeranges):
+        if coalesced and r.start <= coalesced[-1].end:
+            if r.end > coalesced[-1].end:
+                coalesced[-1] = TimeRange(coalesced[-1].start, r.end)
+        else:
+            coalesced.append(r)
+    return coalesced
+
+
+def _union(range_lists: Sequence[List[TimeRange]]) -> List[TimeRange]:
+    range_lists = [rs for rs in range_lists if rs]
+    if len(range_lists) == 1:
+        return list(range_lists[0])
+    return _sweep(range_lists, 1)
+
+
+def _intersection(range_lists: Sequence[List[TimeRange]]) -> List[TimeRange]:
+    if len(range_lists) == 1:
+        return list(range_lists[0])
+    if len(range_lists) == 2:
+        return _intersect(range_lists[0], range_lists[1])
+    return _sweep(range_lists, len(range_lists))
+
+
+def _difference_many(timeranges: List[TimeRange], range_lists: Sequence[List[TimeRange]]) -> List[TimeRange]:
+    range_lists = [rs for rs in range_lists if rs]
+    if not range_lists:
+        return list(timeranges)
+    if len(range_lists) == 1:
+        return _difference(timeranges, range_lists[0])
+    return _difference(timeranges, _sweep(range_lists, 1))
+
+
+def _intersect(timeranges_a: List[TimeRange], timeranges_b: List[TimeRange]) -> List[TimeRange]:
+    """Two-pointer intersection of two sorted, disjoint range lists"""
+    timeranges = []
+    i = j = 0
+    while i < len(timeranges_a) and j < len(timeranges_b):
+        timerange_a = timeranges_a[i]
+        timerange_b = timeranges_b[j]
+        start = max(timerange_a.start, timerange_b.start)
+        if timerange_a.end <= timerange_b.end:
+            end = timerange_a.end
+            i += 1
+        else:
+            end = timerange_b.end
+            j += 1
+        if start < end:
+            timeranges.append(TimeRange(start, end))
+    return timeranges
+
+
+def _difference(timeranges_a: List[TimeRange], timeranges_b: List[TimeRange]) -> List[TimeRange]:
+    """Two-pointer difference of two sorted, disjoint range lists"""
+    timeranges = []
+    j = 0
+    for timerange_a in timeranges_a:
+        while j < len(timeranges_b) and timeranges_b[j].end <= timerange_a.start:
+            j += 1
+        start = timerange_a.start
+        k = j
+        while k < len(timeranges_b) and timeranges_b[k].start < timerange_a.end:
+            if start < timeranges_b[k].start:
+                timeranges.append(TimeRange(start, timeranges_b[k].start))
+            start = timeranges_b[k].end
+            k += 1
+        if start == timerange_a.start:
+            timeranges.append(timerange_a)
+        elif start < timerange_a.end:
+            timeranges.append(TimeRange(start, timerange_a.end))
+    return timeranges
+
+
+def _sorted_order(values: List[int]) -> Sequence[int]:
+    """Indices of `values` in ascending order of value, without sorting if already sorted"""
+    if all(a <= b for a, b in zip(values, itertools.islice(values, 1, None))):
+        return range(len(values))
+    return sorted(range(len(values)), key=values.__getitem__)
+
+
+def _boundaries(timeranges: Iterable[TimeRange]) -> Iterator[Tuple[Time, int]]:
+    for r in timeranges:
+        yield r.start, 1
+        yield r.end, -1
+
+
+def _iter_sweep(range_lists: Sequence[Iterable[TimeRange]], minimum: int, maximum: Optional[int] = None) -> Iterator[TimeRange]:
+    """Lazily yield ranges covered by between `minimum` and `maximum` of the sorted, disjoint range lists"""
+    if maximum is None:
+        maximum = len(range_lists)
+    start = None
+    count = 0
+    previous = None
+    for time, delta in heapq.merge(*(_boundaries(rs) for rs in range_lists)):
+        if time != previous:
+            if (minimum <= count <= maximum) != (start is not None):
+                if start is None:
+                    start = previous
+                else:
+                    yield TimeRange(start, previous)
+                    start = None
+            previous = time
+        count += delta
+    if start is not None:
+        yield TimeRange(start, previous)
+
+
+def _iter_coverage(range_lists: Sequence[Iterable[TimeRange]]) -> Iterator[Tuple[TimeRange, int]]:
+    """Yield each maximal covered segment with the number of range lists covering it"""
+    start = None
+    covered = 0
+    count = 0
+    previous = None
+    for time, delta in heapq.merge(*(_boundaries(rs) for rs in range_lists)):
+        if time != previous:
+            if start is not None and count != covered:
+                yield TimeRange(start, previous), covered
+                start = None
+            if start is None and count:
+                start = previous
+                covered = count
+            previous = time
+        count += delta
+    if start is not None:
+        yield TimeRange(start, previous), covered
+
+
+def _sweep(range_lists: Sequence[Iterable[TimeRange]], minimum: int, maximum: Optional[int] = None) -> List[TimeRange]:
+    """Ranges covered by between `minimum` and `maximum` of the sorted, disjoint range lists"""
+    return list(_iter_sweep(range_lists, minimum, maximum))
+
+
 def timerange_isdisjoint(timerange_a: TimeRange, timerange_b: TimeRange) -> bool:
     return (
         timerange_a.end <= timerange_b.start
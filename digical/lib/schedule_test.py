@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 import pytest
 
 from digical import Time, TimeRange, Schedule
@@ -15,6 +17,27 @@ def test_init():
     assert schedule is not None
 
 
+def test_from_ranges():
+    """Schedule.from_ranges(*TimeRange) -> Schedule"""
+    schedule = Schedule.from_ranges([
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(1500), Time(2000)),
+        TimeRange(Time(1000), Time(1800)),
+        TimeRange(Time(2000), Time(2200)),
+        TimeRange(Time(2600), Time(2700))
+    ])
+    assert schedule.timeranges == (
+        TimeRange(Time(1000), Time(2200)),
+        TimeRange(Time(2500), Time(3000))
+    )
+    timeranges = [
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ]
+    schedule = Schedule.from_ranges(timeranges, normalized=True)
+    assert schedule == Schedule(timeranges)
+
+
 def test_from_json():
     """Schedule.from_json(dict) -> Schedule"""
     schedule = Schedule.from_json({
@@ -93,19 +116,91 @@ def test_len():
     assert len(schedule) == 1500
 
 
+def test_len_mutation():
+    """len(Schedule) -> int"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule.add(TimeRange(Time(1500), Time(2700)))
+    assert len(schedule) == 2000
+    schedule.discard(TimeRange(Time(1200), Time(1300)))
+    assert len(schedule) == 1900
+    schedule.remove(TimeRange(Time(2900), Time(3000)))
+    assert len(schedule) == 1800
+    schedule += 100
+    assert len(schedule) == 1800
+    schedule |= Schedule([TimeRange(Time(5000), Time(5500))])
+    assert len(schedule) == 2300
+    schedule &= Schedule([TimeRange(Time(0), Time(5100))])
+    assert len(schedule) == 1900
+    schedule -= Schedule([TimeRange(Time(5000), Time(5100))])
+    assert len(schedule) == 1800
+    schedule ^= Schedule([TimeRange(Time(0), Time(1000))])
+    assert len(schedule) == 2800
+    schedule.pop()
+    assert len(schedule) == sum(len(r) for r in schedule.timeranges)
+
+
 def test_timeranges():
     """Schedule.timeranges -> *TimeRange"""
     timeranges = Schedule([
         TimeRange(Time(1000), Time(2000)),
         TimeRange(Time(2500), Time(3000))
     ]).timeranges
-    assert isinstance(timeranges, tuple)
+    assert isinstance(timeranges, Sequence)
     assert timeranges == (
         TimeRange(Time(1000), Time(2000)),
         TimeRange(Time(2500), Time(3000))
     )
 
 
+def test_timeranges_view():
+    """Schedule.timeranges -> *TimeRange"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(3500), Time(4000))
+    ])
+    timeranges = schedule.timeranges
+    assert len(timeranges) == 3
+    assert timeranges[0] == TimeRange(Time(1000), Time(2000))
+    assert timeranges[-1] == TimeRange(Time(3500), Time(4000))
+    assert timeranges[1:] == (
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(3500), Time(4000))
+    )
+    assert list(timeranges) == list(schedule.copy().timeranges)
+    assert TimeRange(Time(2500), Time(3000)) in timeranges
+    assert TimeRange(Time(2500), Time(2900)) not in timeranges
+    assert timeranges.index(TimeRange(Time(3500), Time(4000))) == 2
+    with pytest.raises(TypeError):
+        timeranges[0] = TimeRange(Time(0), Time(100))
+    schedule.add(TimeRange(Time(5000), Time(5500)))
+    assert len(timeranges) == 4
+    schedule &= Schedule()
+    assert len(timeranges) == 0
+
+
+def test_timeranges_view_modified():
+    """Schedule.timeranges -> *TimeRange"""
+    schedule = Schedule([
+        TimeRange(Time(0), Time(10)),
+        TimeRange(Time(20), Time(30))
+    ])
+    assert (None in schedule.timeranges) is False
+    assert (Time(5) in schedule.timeranges) is False
+    with pytest.raises(RuntimeError):
+        for r in schedule.timeranges:
+            schedule.discard(r)
+    with pytest.raises(RuntimeError):
+        for r in reversed(schedule.timeranges):
+            schedule.add(TimeRange(Time(100), Time(110)))
+    for r in list(schedule.timeranges):
+        schedule.discard(r)
+    assert schedule == Schedule()
+
+
 def test_eq():
     """Schedule == Schedule -> bool"""
     schedule_a = Schedule([
@@ -249,6 +344,36 @@ def test_add_timerange():
     ])
 
 
+def test_add_timerange_window():
+    """Schedule.add(TimeRange) -> None"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(3500), Time(4000)),
+        TimeRange(Time(4500), Time(5000))
+    ])
+    schedule.add(TimeRange(Time(2000), Time(3500)))
+    assert schedule == Schedule([
+        TimeRange(Time(1000), Time(4000)),
+        TimeRange(Time(4500), Time(5000))
+    ])
+    schedule.add(TimeRange(Time(100), Time(200)))
+    schedule.add(TimeRange(Time(6000), Time(7000)))
+    schedule.add(TimeRange(Time(4200), Time(4300)))
+    assert schedule.timeranges == (
+        TimeRange(Time(100), Time(200)),
+        TimeRange(Time(1000), Time(4000)),
+        TimeRange(Time(4200), Time(4300)),
+        TimeRange(Time(4500), Time(5000)),
+        TimeRange(Time(6000), Time(7000))
+    )
+    schedule.add(TimeRange(Time(1500), Time(1600)))
+    schedule.add(TimeRange(Time(0), Time(8000)))
+    assert schedule.timeranges == (
+        TimeRange(Time(0), Time(8000)),
+    )
+
+
 def test_remove_timerange():
     """Schedule.remove(TimeRange) -> None"""
     schedule = Schedule([
@@ -285,6 +410,306 @@ def test_discard_timerange():
     ])
 
 
+def test_discard_timerange_window():
+    """Schedule.discard(TimeRange) -> None"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(3500), Time(4000)),
+        TimeRange(Time(4500), Time(5000))
+    ])
+    schedule.discard(TimeRange(Time(2000), Time(2500)))
+    schedule.discard(TimeRange(Time(1500), Time(3700)))
+    assert schedule == Schedule([
+        TimeRange(Time(1000), Time(1500)),
+        TimeRange(Time(3700), Time(4000)),
+        TimeRange(Time(4500), Time(5000))
+    ])
+    schedule.discard(TimeRange(Time(4600), Time(4700)))
+    assert schedule == Schedule([
+        TimeRange(Time(1000), Time(1500)),
+        TimeRange(Time(3700), Time(4000)),
+        TimeRange(Time(4500), Time(4600)),
+        TimeRange(Time(4700), Time(5000))
+    ])
+    with pytest.raises(KeyError):
+        schedule.remove(TimeRange(Time(4500), Time(5000)))
+
+
+def test_slice():
+    """Schedule.slice(Time, Time) -> Schedule"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(3500), Time(4000))
+    ])
+    assert schedule.slice(Time(1500), Time(2700)) == Schedule([
+        TimeRange(Time(1500), Time(2000)),
+        TimeRange(Time(2500), Time(2700))
+    ])
+    assert schedule.slice(Time(2000), Time(2500)) == Schedule()
+    assert schedule.slice(Time(2600), Time(2700)) == Schedule([
+        TimeRange(Time(2600), Time(2700))
+    ])
+    assert schedule.slice(Time(0), Time(5000)) == schedule
+    assert schedule.slice(Time(3000), Time(1000)) == Schedule()
+
+
+def test_iter_between():
+    """Schedule.iter_between(Time, Time) -> *TimeRange"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(3500), Time(4000))
+    ])
+    assert list(schedule.iter_between(Time(1500), Time(2700))) == [
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ]
+    assert list(schedule.iter_between(Time(2000), Time(2500))) == []
+    assert list(schedule.iter_between(Time(4000), Time(5000))) == []
+
+
+def test_find_common_slot():
+    """Schedule.find_common_slot(*Schedule, int, Time) -> TimeRange"""
+    schedule_a = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(4000))
+    ])
+    schedule_b = Schedule([
+        TimeRange(Time(1800), Time(2700)),
+        TimeRange(Time(3000), Time(5000))
+    ])
+    schedule_c = Schedule([
+        TimeRange(Time(0), Time(6000))
+    ])
+    schedules = [schedule_a, schedule_b, schedule_c]
+    assert Schedule.find_common_slot(schedules, 100) == TimeRange(Time(1800), Time(2000))
+    assert Schedule.find_common_slot(schedules, 500) == TimeRange(Time(3000), Time(4000))
+    assert Schedule.find_common_slot(schedules, 100, after=Time(1950)) == TimeRange(Time(2500), Time(2700))
+    assert Schedule.find_common_slot(schedules, 100, after=Time(3500)) == TimeRange(Time(3500), Time(4000))
+    assert Schedule.find_common_slot(schedules, 2000) is None
+    assert Schedule.find_common_slot([], 100) is None
+
+
+def test_find_common_slots():
+    """Schedule.find_common_slots(*Schedule, int, int, Time) -> [TimeRange]"""
+    schedule_a = Schedule([
+        TimeRange(Time(i * 100), Time(i * 100 + 60)) for i in range(100)
+    ])
+    schedule_b = Schedule([
+        TimeRange(Time(i * 100 + 30), Time(i * 100 + 100)) for i in range(100)
+    ])
+    assert Schedule.find_common_slots([schedule_a, schedule_b], 30, 2) == [
+        TimeRange(Time(30), Time(60)),
+        TimeRange(Time(130), Time(160))
+    ]
+    assert Schedule.find_common_slots([schedule_a, schedule_b], 30, 2, after=Time(9950)) == []
+    assert len(Schedule.find_common_slots([schedule_a, schedule_b], 10, 500)) == 100
+
+
+def test_quorum():
+    """Schedule.quorum(*Schedule, int) -> Schedule"""
+    schedule_a = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule_b = Schedule([
+        TimeRange(Time(1500), Time(2700))
+    ])
+    schedule_c = Schedule([
+        TimeRange(Time(1800), Time(2600))
+    ])
+    schedules = [schedule_a, schedule_b, schedule_c]
+    assert Schedule.quorum(schedules, 1) == Schedule.union(*schedules)
+    assert Schedule.quorum(schedules, 2) == Schedule([
+        TimeRange(Time(1500), Time(2700))
+    ])
+    assert Schedule.quorum(schedules, 3) == Schedule.intersection(*schedules)
+    assert Schedule.quorum(schedules, 4) == Schedule()
+    with pytest.raises(ValueError):
+        Schedule.quorum(schedules, 0)
+
+
+def test_coverage():
+    """Schedule.coverage(*Schedule) -> [(TimeRange, int)]"""
+    schedule_a = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    schedule_b = Schedule([
+        TimeRange(Time(1500), Time(2500))
+    ])
+    assert Schedule.coverage([schedule_a, schedule_b]) == [
+        (TimeRange(Time(1000), Time(1500)), 1),
+        (TimeRange(Time(1500), Time(2000)), 2),
+        (TimeRange(Time(2000), Time(3000)), 1)
+    ]
+    assert Schedule.coverage([]) == []
+
+
+def test_measure():
+    """Schedule.measure(Time, Time) -> int"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert schedule.measure(Time(0), Time(5000)) == 1500
+    assert schedule.measure(Time(1500), Time(2700)) == 700
+    assert schedule.measure(Time(2000), Time(2500)) == 0
+    assert schedule.measure(Time(1200), Time(1300)) == 100
+    assert schedule.measure(Time(2700), Time(1500)) == 0
+    schedule.add(TimeRange(Time(2000), Time(2200)))
+    assert schedule.measure(Time(1500), Time(2700)) == 900
+    schedule.pop()
+    assert schedule.measure(Time(1500), Time(2700)) == 700
+    schedule += 100
+    assert schedule.measure(Time(1500), Time(2700)) == 800
+
+
+def test_contains_many():
+    """Schedule.contains_many(*Time) -> [bool]"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    times = [Time(500), Time(1000), Time(1500), Time(2000), Time(2250), Time(2500), Time(3000)]
+    assert schedule.contains_many(times) == [False, True, True, False, False, True, False]
+    assert schedule.contains_many(reversed(times)) == [False, True, False, False, True, True, False]
+    assert schedule.contains_many([2750, 1000, 500]) == [True, True, False]
+    assert schedule.contains_many([]) == []
+
+
+def test_measure_many():
+    """Schedule.measure_many(*TimeRange) -> [int]"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert schedule.measure_many([
+        TimeRange(Time(1500), Time(2700)),
+        TimeRange(Time(0), Time(5000)),
+        TimeRange(Time(2000), Time(2500)),
+        TimeRange(Time(1200), Time(1300))
+    ]) == [700, 1500, 0, 100]
+    assert schedule.measure_many([]) == []
+
+
+def test_select():
+    """Schedule.select(int) -> Time"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert schedule.select(0) == Time(1000)
+    assert schedule.select(999) == Time(1999)
+    assert schedule.select(1000) == Time(2500)
+    assert schedule.select(1499) == Time(2999)
+    with pytest.raises(IndexError):
+        schedule.select(1500)
+    with pytest.raises(IndexError):
+        schedule.select(-1)
+
+
+def test_advance():
+    """Schedule.advance(Time, int) -> Time"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert schedule.advance(Time(0), 1000) == Time(2000)
+    assert schedule.advance(Time(0), 1001) == Time(2501)
+    assert schedule.advance(Time(1500), 600) == Time(2600)
+    assert schedule.advance(Time(2200), 500) == Time(3000)
+    assert schedule.advance(Time(2200), 0) == Time(2200)
+    with pytest.raises(ValueError):
+        schedule.advance(Time(2200), 501)
+    with pytest.raises(ValueError):
+        schedule.advance(Time(2200), -1)
+
+
+def test_next_gap():
+    """Schedule.next_gap(Time, int) -> Time"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2100), Time(2500)),
+        TimeRange(Time(3000), Time(3200))
+    ])
+    assert schedule.next_gap(Time(0), 500) == Time(0)
+    assert schedule.next_gap(Time(600), 500) == Time(2500)
+    assert schedule.next_gap(Time(1500), 100) == Time(2000)
+    assert schedule.next_gap(Time(1500), 101) == Time(2500)
+    assert schedule.next_gap(Time(2600), 500) == Time(3200)
+    assert schedule.next_gap(Time(4000), 300) == Time(4000)
+    schedule.add(TimeRange(Time(2500), Time(3000)))
+    assert schedule.next_gap(Time(1500), 101) == Time(3200)
+    schedule.discard(TimeRange(Time(1200), Time(1400)))
+    assert schedule.next_gap(Time(1000), 200) == Time(1200)
+    assert Schedule().next_gap(Time(100), 1000) == Time(100)
+
+
+def test_next_gap_after_mutation():
+    """Schedule.next_gap(Time, int) -> Time"""
+    def scan(schedule, after, duration):
+        time = after
+        for r in schedule.timeranges:
+            if r.end <= time:
+                continue
+            if r.start.value - time.value >= duration:
+                return time
+            time = max(time, r.end)
+        return time
+
+    schedule = Schedule([
+        TimeRange(Time(i * 100), Time(i * 100 + 60)) for i in range(500)
+    ])
+    assert schedule.next_gap(Time(0), 40) == Time(60)
+    mutations = [
+        (schedule.add, TimeRange(Time(60), Time(70))),
+        (schedule.add, TimeRange(Time(165), Time(170))),
+        (schedule.add, TimeRange(Time(250), Time(420))),
+        (schedule.discard, TimeRange(Time(5010), Time(5030))),
+        (schedule.add, TimeRange(Time(1000), Time(30000))),
+        (schedule.discard, TimeRange(Time(20000), Time(20045))),
+        (schedule.add, TimeRange(Time(60000), Time(60010)))
+    ]
+    for mutate, timerange in mutations:
+        mutate(timerange)
+        for after in range(0, 61000, 997):
+            for duration in (1, 30, 40, 45):
+                assert schedule.next_gap(Time(after), duration) == scan(schedule, Time(after), duration)
+    schedule.pop()
+    assert schedule.next_gap(Time(59000), 50) == scan(schedule, Time(59000), 50)
+
+
+def test_largest_gap():
+    """Schedule.largest_gap(Time, Time) -> TimeRange"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2100), Time(2500)),
+        TimeRange(Time(3000), Time(3200))
+    ])
+    assert schedule.largest_gap(Time(0), Time(4000)) == TimeRange(Time(0), Time(1000))
+    assert schedule.largest_gap(Time(900), Time(3100)) == TimeRange(Time(2500), Time(3000))
+    assert schedule.largest_gap(Time(1500), Time(2300)) == TimeRange(Time(2000), Time(2100))
+    assert schedule.largest_gap(Time(1500), Time(1800)) is None
+    assert schedule.largest_gap(Time(4000), Time(5000)) == TimeRange(Time(4000), Time(5000))
+
+
+def test_complement():
+    """Schedule.complement(Time, Time) -> Schedule"""
+    schedule = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000))
+    ])
+    assert schedule.complement(Time(500), Time(2700)) == Schedule([
+        TimeRange(Time(500), Time(1000)),
+        TimeRange(Time(2000), Time(2500))
+    ])
+    assert schedule.complement(Time(1200), Time(1800)) == Schedule()
+    assert schedule.complement(Time(3000), Time(2000)) == Schedule()
+
+
 def test_pop():
     """Schedule.pop() -> elem"""
     schedule = Schedule([
@@ -474,6 +899,27 @@ def test_union():
     ])
 
 
+def test_union_many():
+    """Schedule.union(*Schedule) -> Schedule"""
+    schedules = [
+        Schedule([
+            TimeRange(Time(i * 100), Time(i * 100 + 50)),
+            TimeRange(Time(i * 100 + 50), Time(i * 100 + 100))
+        ])
+        for i in range(1, 40, 2)
+    ]
+    schedules.append(Schedule())
+    assert schedules[0].union(*schedules[1:]) == Schedule([
+        TimeRange(Time(i * 100), Time(i * 100 + 100))
+        for i in range(1, 40, 2)
+    ])
+    assert Schedule().union(*schedules) == schedules[0].union(*schedules[1:])
+    assert schedules[0] | schedules[1] == Schedule([
+        TimeRange(Time(100), Time(200)),
+        TimeRange(Time(300), Time(400))
+    ])
+
+
 def test_intersection():
     """Schedule.intersection(*Schedule) -> Schedule"""
     """Schedule & Schedule -> Schedule"""
@@ -498,6 +944,23 @@ def test_intersection():
     ])
 
 
+def test_intersection_many():
+    """Schedule.intersection(*Schedule) -> Schedule"""
+    schedules = [
+        Schedule([
+            TimeRange(Time(1000 + i * 10), Time(2000)),
+            TimeRange(Time(2000 + i * 10), Time(3000 - i * 10))
+        ])
+        for i in range(30)
+    ]
+    assert schedules[0].intersection(*schedules[1:]) == Schedule([
+        TimeRange(Time(1290), Time(2000)),
+        TimeRange(Time(2290), Time(2710))
+    ])
+    assert schedules[0] & Schedule([TimeRange(Time(3000), Time(4000))]) == Schedule()
+    assert schedules[0].intersection(schedules[1], Schedule()) == Schedule()
+
+
 def test_difference():
     """Schedule.difference(*Schedule) -> Schedule"""
     """Schedule - Schedule -> Schedule"""
@@ -521,6 +984,30 @@ def test_difference():
     ])
 
 
+def test_difference_spanning():
+    """Schedule.difference(*Schedule) -> Schedule"""
+    schedule_a = Schedule([
+        TimeRange(Time(1000), Time(2000)),
+        TimeRange(Time(2500), Time(3000)),
+        TimeRange(Time(3500), Time(4000))
+    ])
+    schedule_b = Schedule([
+        TimeRange(Time(1100), Time(1200)),
+        TimeRange(Time(1300), Time(1400)),
+        TimeRange(Time(1900), Time(2600)),
+        TimeRange(Time(4000), Time(4500))
+    ])
+    assert schedule_a - schedule_b == Schedule([
+        TimeRange(Time(1000), Time(1100)),
+        TimeRange(Time(1200), Time(1300)),
+        TimeRange(Time(1400), Time(1900)),
+        TimeRange(Time(2600), Time(3000)),
+        TimeRange(Time(3500), Time(4000))
+    ])
+    assert schedule_a ^ schedule_a == Schedule()
+    assert schedule_a ^ Schedule() == schedule_a
+
+
 def test_symmetric_difference():
     """Schedule.symmetric_difference(Schedule) -> Schedule"""
     """Schedule ^ Schedule -> Schedule"""
@@ -0,0 +1,263 @@
+from __future__ import annotations
+from typing import Dict, Hashable, Iterator, List, Mapping, Optional, Set, Tuple
+import bisect
+import math
+
+from .timerange import Time, TimeRange
+from .schedule import _BaseSchedule
+
+# (start, end, serial) for one range of one member
+Interval = Tuple[int, int, int]
+
+# A subtree of n ranges is rebuilt once a path in it is longer than
+# log(n) / log(1 / _BALANCE), as in a scapegoat tree
+_BALANCE = 0.7
+
+
+class _Node:
+    """
+    A node of a centered interval tree. It holds the intervals with
+    start <= center < end, sorted by start and by end; intervals that end
+    at or before the center go left, those starting after it go right.
+    """
+    __slots__ = ("center", "by_start", "by_end", "left", "right", "size")
+
+    def __init__(self, center: int):
+        self.center = center
+        self.size = 0
+        self.by_start: List[Tuple[int, int]] = []
+        self.by_end: List[Tuple[int, int]] = []
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+
+
+class ScheduleIndex:
+    """
+    An index over many Schedules keyed by id, answering which members are
+    free at a Time or for a whole TimeRange without scanning every member.
+    The ranges of all members are kept in a centered interval tree.
+    """
+    __slots__ = ("_root", "_intervals", "_members", "_serial", "_built", "_changes")
+
+    def __init__(self, schedules: Optional[Mapping[Hashable, _BaseSchedule]] = None):
+        """ScheduleIndex() -> ScheduleIndex"""
+        """ScheduleIndex({key: Schedule}) -> ScheduleIndex"""
+        self._intervals: Dict[int, Tuple[Hashable, int, int]] = {}
+        self._members: Dict[Hashable, List[int]] = {}
+        self._serial = 0
+        for key, schedule in (schedules or {}).items():
+            self._register(key, schedule)
+        self.rebuild()
+
+    def __repr__(self) -> str:
+        """repr(ScheduleIndex) -> repr"""
+        return f"ScheduleIndex({len(self._members)} members, {len(self._intervals)} ranges)"
+
+    def __len__(self):
+        """len(ScheduleIndex) -> int"""
+        return len(self._members)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """key in ScheduleIndex -> bool"""
+        return key in self._members
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """iter(ScheduleIndex) -> *key"""
+        return iter(self._members)
+
+    def _register(self, key: Hashable, schedule: _BaseSchedule) -> List[Interval]:
+        serials = []
+        intervals = []
+        for r in schedule.timeranges:
+            serial = self._serial
+            self._serial += 1
+            self._intervals[serial] = (key, r.start.value, r.end.value)
+            serials.append(serial)
+            intervals.append((r.start.value, r.end.value, serial))
+        self._members[key] = serials
+        return intervals
+
+    def rebuild(self) -> None:
+        """Rebalance the tree over the current ranges"""
+        intervals = [(start, end, serial) for serial, (_, start, end) in self._intervals.items()]
+        self._root = _build(intervals)
+        self._built = len(intervals)
+        self._changes = 0
+
+    def add(self, key: Hashable, schedule: _BaseSchedule) -> None:
+        """Index `schedule` under `key`, replacing any schedule already there"""
+        self.discard(key)
+        intervals = self._register(key, schedule)
+        self._changes += len(intervals)
+        if self._changes > self._built:
+            self.rebuild()
+            return
+        for interval in intervals:
+            self._insert(interval)
+
+    def remove(self, key: Hashable) -> None:
+        if key not in self._members:
+            raise KeyError(key)
+        self.discard(key)
+
+    def discard(self, key: Hashable) -> None:
+        serials = self._members.pop(key, ())
+        self._changes += len(serials)
+        if self._changes > self._built:
+            for serial in serials:
+                del self._intervals[serial]
+            self.rebuild()
+            return
+        for serial in serials:
+            _, start, end = self._intervals.pop(serial)
+            self._delete((start, end, serial))
+
+    def _insert(self, interval: Interval) -> None:
+        start, end, serial = interval
+        if self._root is None:
+            self._root = _Node(start)
+        path = [self._root]
+        node = self._root
+        node.size += 1
+        while not start <= node.center < end:
+            if end <= node.center:
+                if node.left is None:
+                    node.left = _Node(start)
+                node = node.left
+            else:
+                if node.right is None:
+                    node.right = _Node(start)
+                node = node.right
+            node.size += 1
+            path.append(node)
+        bisect.insort(node.by_start, (start, serial))
+        bisect.insort(node.by_end, (end, serial))
+        if len(path) - 1 > _height_limit(self._root.size):
+            self._rebalance(path)
+
+    def _rebalance(self, path: List[_Node]) -> None:
+        """Rebuild the lowest subtree on a too-long path that is too deep for its size"""
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            if len(path) - 1 - depth > _height_limit(node.size):
+                subtree = _build(list(self._collect(node)))
+                if depth == 0:
+                    self._root = subtree
+                elif path[depth - 1].left is node:
+                    path[depth - 1].left = subtree
+                else:
+                    path[depth - 1].right = subtree
+                return
+
+    def _delete(self, interval: Interval) -> None:
+        start, end, serial = interval
+        parent = None
+        node = self._root
+        node.size -= 1
+        while not start <= node.center < end:
+            parent = node
+            node = node.left if end <= node.center else node.right
+            node.size -= 1
+        del node.by_start[bisect.bisect_left(node.by_start, (start, serial))]
+        del node.by_end[bisect.bisect_left(node.by_end, (end, serial))]
+        # An emptied node with at most one child is spliced out; its child
+        # lies on the same side of the parent, so the order still holds
+        if node.by_start or (node.left is not None and node.right is not None):
+            return
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self._root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+    def _collect(self, node: _Node) -> Iterator[Interval]:
+        """Yield every interval in a subtree"""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            for _, serial in node.by_start:
+                _, start, end = self._intervals[serial]
+                yield start, end, serial
+            stack.append(node.left)
+            stack.append(node.right)
+
+    def _depth(self) -> int:
+        """Number of nodes on the longest path from the root"""
+        depth = 0
+        level = [self._root] if self._root is not None else []
+        while level:
+            depth += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return depth
+
+    def _stab(self, time: int) -> Iterator[int]:
+        """Yield the serial of every interval containing `time`"""
+        node = self._root
+        while node is not None:
+            if time < node.center:
+                for start, serial in node.by_start:
+                    if start > time:
+                        break
+                    yield serial
+                node = node.left
+            else:
+                for end, serial in reversed(node.by_end):
+                    if end <= time:
+                        break
+                    yield serial
+                node = node.right if time > node.center else None
+
+    def at(self, time: Time) -> Set[Hashable]:
+        """ScheduleIndex.at(Time) -> {key}"""
+        return {self._intervals[serial][0] for serial in self._stab(time.value)}
+
+    def covering(self, timerange: TimeRange) -> Set[Hashable]:
+        """ScheduleIndex.covering(TimeRange) -> {key}"""
+        end = timerange.end.value
+        members = set()
+        for serial in self._stab(timerange.start.value):
+            key, _, interval_end = self._intervals[serial]
+            if interval_end >= end:
+                members.add(key)
+        return members
+
+
+def _build(intervals: List[Interval]) -> Optional[_Node]:
+    """Build a balanced tree over the intervals"""
+    if not intervals:
+        return None
+    intervals.sort()
+    return _build_sorted(intervals)
+
+
+def _build_sorted(intervals: List[Interval]) -> Optional[_Node]:
+    # The median start is held by its own node, so every level makes progress;
+    # partitioning keeps both sides sorted by start
+    node = _Node(intervals[len(intervals) // 2][0])
+    left = []
+    right = []
+    for interval in intervals:
+        start, end, serial = interval
+        if end <= node.center:
+            left.append(interval)
+        elif start > node.center:
+            right.append(interval)
+        else:
+            node.by_start.append((start, serial))
+            node.by_end.append((end, serial))
+    node.by_start.sort()
+    node.by_end.sort()
+    node.size = len(intervals)
+    if left:
+        node.left = _build_sorted(left)
+    if right:
+        node.right = _build_sorted(right)
+    return node
+
+
+def _height_limit(size: int) -> float:
+    return math.log(max(size, 1)) / -math.log(_BALANCE)
@@ -0,0 +1,108 @@
+import pytest
+
+from digical import Time, TimeRange, Schedule, ScheduleIndex
+
+
+def make_index():
+    return ScheduleIndex({
+        "a": Schedule([
+            TimeRange(Time(1000), Time(2000)),
+            TimeRange(Time(2500), Time(3000))
+        ]),
+        "b": Schedule([
+            TimeRange(Time(1500), Time(2700))
+        ]),
+        "c": Schedule([
+            TimeRange(Time(0), Time(1200))
+        ])
+    })
+
+
+def test_init():
+    """ScheduleIndex({key: Schedule}) -> ScheduleIndex"""
+    index_empty = ScheduleIndex()
+    assert len(index_empty) == 0
+    assert index_empty.at(Time(1000)) == set()
+    index = make_index()
+    assert len(index) == 3
+    assert ("a" in index) is True
+    assert ("d" in index) is False
+    assert set(index) == {"a", "b", "c"}
+
+
+def test_at():
+    """ScheduleIndex.at(Time) -> {key}"""
+    index = make_index()
+    assert index.at(Time(500)) == {"c"}
+    assert index.at(Time(1100)) == {"a", "c"}
+    assert index.at(Time(1200)) == {"a"}
+    assert index.at(Time(1600)) == {"a", "b"}
+    assert index.at(Time(2000)) == {"b"}
+    assert index.at(Time(2600)) == {"a", "b"}
+    assert index.at(Time(3000)) == set()
+
+
+def test_covering():
+    """ScheduleIndex.covering(TimeRange) -> {key}"""
+    index = make_index()
+    assert index.covering(TimeRange(Time(1000), Time(1200))) == {"a", "c"}
+    assert index.covering(TimeRange(Time(1500), Time(2000))) == {"a", "b"}
+    assert index.covering(TimeRange(Time(1500), Time(2600))) == {"b"}
+    assert index.covering(TimeRange(Time(1900), Time(2600))) == {"b"}
+    assert index.covering(TimeRange(Time(1000), Time(3000))) == set()
+
+
+def test_add_remove():
+    """ScheduleIndex.add(key, Schedule) -> None"""
+    """ScheduleIndex.remove(key) -> None"""
+    index = make_index()
+    index.add("d", Schedule([
+        TimeRange(Time(1100), Time(1600))
+    ]))
+    assert index.at(Time(1100)) == {"a", "c", "d"}
+    index.add("a", Schedule([
+        TimeRange(Time(5000), Time(6000))
+    ]))
+    assert index.at(Time(1100)) == {"c", "d"}
+    assert index.at(Time(5500)) == {"a"}
+    index.remove("c")
+    assert index.at(Time(1100)) == {"d"}
+    with pytest.raises(KeyError):
+        index.remove("c")
+    index.discard("c")
+    assert len(index) == 3
+
+
+def test_matches_scan():
+    """ScheduleIndex agrees with checking every Schedule"""
+    schedules = {
+        i: Schedule([
+            TimeRange(Time(j * 100 + i * 7), Time(j * 100 + i * 7 + 20 + i)) for j in range(10)
+        ])
+        for i in range(40)
+    }
+    index = ScheduleIndex()
+    for key, schedule in schedules.items():
+        index.add(key, schedule)
+    for t in range(0, 1300, 13):
+        assert index.at(Time(t)) == {k for k, s in schedules.items() if Time(t) in s}
+        timerange = TimeRange(Time(t), Time(t + 15))
+        assert index.covering(timerange) == {k for k, s in schedules.items() if timerange in s}
+
+
+def test_depth_after_churn():
+    """ScheduleIndex stays balanced under in-order adds and replacements"""
+    index = ScheduleIndex({
+        i: Schedule([TimeRange(Time(i * 100), Time(i * 100 + 50))]) for i in range(1000)
+    })
+    for i in range(1000, 2000):
+        index.add(i, Schedule([TimeRange(Time(i * 100), Time(i * 100 + 50))]))
+        assert index._depth() <= 40
+    for i in range(5000):
+        key = i * 7 % 2000
+        start = (i * 7919) % 200000
+        index.add(key, Schedule([TimeRange(Time(start), Time(start + 50))]))
+        if i % 100 == 0:
+            assert index._depth() <= 40
+    assert len(index) == 2000
+    assert index.at(Time(start + 10)) >= {key}
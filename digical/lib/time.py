@@ -1,21 +1,38 @@
 from __future__ import annotations
-from functools import total_ordering
-from typing import Union
+from typing import Dict, Union
 
+MINUTES_PER_DAY = 60 * 24
+MINUTES_PER_WEEK = MINUTES_PER_DAY * 7
 
-@total_ordering
-class Time:
+
+class Time(int):
+    """
+    A minute, stored as the int itself so that construction, hashing and
+    comparisons between Times run as int operations.
+    """
+    __slots__ = ()
     _weekdays = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+    # Minute-of-week Times handed out by Time.of are shared; Time is immutable
+    _interned: Dict[int, Time] = {}
+
+    def __reduce__(self):
+        return (type(self), (int(self), ))
 
-    def __init__(self, value: int):
-        """Time(int) -> Time"""
-        self._value = value
+    @classmethod
+    def of(cls, value: int) -> Time:
+        """Time.of(int) -> Time"""
+        if cls is not Time or type(value) is not int or not 0 <= value < MINUTES_PER_WEEK:
+            return cls(value)
+        time = Time._interned.get(value)
+        if time is None:
+            time = Time._interned[value] = Time(value)
+        return time
 
     @classmethod
     def from_dhm(cls, day: int, hour: int, minutes: int) -> Time:
         """Time.from_dhm(int, int, int) -> Time"""
         value = minutes + (hour * 60) + (day * 60 * 24)
-        return cls(value)
+        return cls.of(value)
 
     @classmethod
     def from_json(cls, j: dict) -> Time:
@@ -24,27 +41,22 @@ class Time:
 
     def to_json(self) -> dict:
         """Time.to_json() -> dict"""
-        return {"value": self._value}
+        return {"value": int(self)}
 
     def copy(self):
         """Time.copy() -> Time"""
-        return Time(self._value)
-
-    def __hash__(self) -> int:
-        return hash(self._value)
+        return Time(int(self))
 
     def __repr__(self) -> str:
         """repr(Time) -> str"""
-        return f"Time({self._value})"
+        return f"Time({int(self)})"
 
     def __str__(self) -> str:
         """str(Time) -> str"""
         return f"{self.dayname}, {self.hour}:{self.minute:02}"
 
-    @property
-    def value(self) -> int:
-        """Time.value -> int"""
-        return self._value
+    # int itself is the getter, so reading .value runs no Python code
+    value = property(int, doc="Time.value -> int")
 
     @property
     def weekday(self) -> int:
@@ -54,42 +66,28 @@ class Time:
     @property
     def day(self) -> int:
         """Time.day -> int"""
-        return self._value // (60 * 24)
+        return int(self) // (60 * 24)
 
     @property
     def hour(self) -> int:
         """Time.hour -> int"""
-        total_hours = self._value // 60
+        total_hours = int(self) // 60
         return total_hours % 24
 
     @property
     def minute(self) -> int:
         """Time.minute -> int"""
-        return self._value % 60
+        return int(self) % 60
 
     @property
     def dayname(self) -> str:
         """Time.dayname -> str"""
         return self._weekdays[self.weekday]
 
-    def __lt__(self, other: Time) -> bool:
-        """Time < Time -> bool"""
-        if isinstance(other, Time):
-            return self._value < other._value
-        else:
-            return NotImplemented
-
-    def __eq__(self, other: Time) -> bool:
-        """Time == Time -> bool"""
-        if isinstance(other, Time):
-            return self._value == other._value
-        else:
-            return NotImplemented
-
     def __add__(self, other: int) -> Time:
         """Time + int -> Time"""
-        if isinstance(other, int):
-            return Time(self._value + other)
+        if isinstance(other, int) and not isinstance(other, Time):
+            return Time(int(self) + other)
         else:
             return NotImplemented
 
@@ -103,8 +101,8 @@ class Time:
         Time - Time -> int
         """
         if isinstance(other, Time):
-            return self._value - other._value
+            return int(self) - int(other)
         elif isinstance(other, int):
-            return Time(self._value - other)
+            return Time(int(self) - other)
         else:
             return NotImplemented
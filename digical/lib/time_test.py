@@ -1,3 +1,9 @@
+import pickle
+import timeit
+from functools import total_ordering
+
+import pytest
+
 from digical import Time
 
 
@@ -164,3 +170,68 @@ def test_sub_time():
     """Time - Time -> int"""
     minutes = Time(120) - Time(100)
     assert minutes == 20
+
+
+def test_immutable():
+    """Time is immutable"""
+    time = Time(1563)
+    with pytest.raises(AttributeError):
+        time.value = 1000
+    with pytest.raises(AttributeError):
+        time.extra = 1000
+    assert time.value == 1563
+
+
+def test_of():
+    """Time.of(int) -> Time"""
+    assert Time.of(1563) is Time.of(1563)
+    assert Time.from_dhm(1, 2, 3) is Time.of(1563)
+    assert Time(1563) is not Time.of(1563)
+    assert Time.of(1563).copy() is not Time.of(1563)
+    assert Time.of(-1) == Time(-1)
+    assert Time.of(100000) == Time(100000)
+
+
+class SubTime(Time):
+    __slots__ = ()
+
+
+def test_of_exact():
+    """Time.of(int) -> Time"""
+    assert type(Time.of(True)) is Time
+    assert Time.of(True) is not Time.of(1)
+    assert type(SubTime.of(7)) is SubTime
+    assert SubTime.of(7) is not Time.of(7)
+
+
+@total_ordering
+class BaselineTime:
+    """Time as it was before it was int-backed"""
+
+    def __init__(self, value):
+        self._value = value
+
+    def __lt__(self, other):
+        if isinstance(other, BaselineTime):
+            return self._value < other._value
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, BaselineTime):
+            return self._value == other._value
+        return NotImplemented
+
+
+def test_construction_speed():
+    """Time(int) -> Time"""
+    def best(stmt):
+        return min(timeit.repeat(stmt, globals=globals(), number=20000, repeat=5))
+    assert best("Time(500000)") <= best("BaselineTime(500000)")
+    assert best("Time(500)") <= best("BaselineTime(500)")
+
+
+def test_pickle():
+    """pickle.loads(pickle.dumps(Time)) -> Time"""
+    time = Time(100000)
+    assert pickle.loads(pickle.dumps(time)) == time
+    assert type(pickle.loads(pickle.dumps(SubTime(10)))) is SubTime
@@ -1,10 +1,12 @@
 from __future__ import annotations
-from typing import Union
+from typing import Tuple, Union
 
 from .time import Time
 
 
 class TimeRange:
+    __slots__ = ("_start", "_end")
+
     def __init__(self, start: Time, end: Time):
         """TimeRange(Time, Time) -> TimeRange"""
         if start >= end:
@@ -12,6 +14,9 @@ class TimeRange:
         self._start = start
         self._end = end
 
+    def __reduce__(self):
+        return (type(self), (self._start, self._end))
+
     @classmethod
     def from_json(cls, j: dict) -> TimeRange:
         """TimeRange.from_json(dict) -> TimeRange"""
@@ -36,7 +41,7 @@ class TimeRange:
 
     def __hash__(self) -> int:
         """hash(TimeRange) -> int"""
-        return hash((self.start, self.end))
+        return hash((self._start, self._end))
 
     def __repr__(self) -> str:
         return f"TimeRange({self.start!r}, {self.end!r})"
@@ -46,7 +51,7 @@ class TimeRange:
 
     def __len__(self) -> int:
         """len(TimeRange) -> int"""
-        return self.end - self.start
+        return int(self._end) - int(self._start)
 
     @property
     def start(self) -> int:
@@ -85,19 +90,22 @@ class TimeRange:
         """Time in TimeRange -> bool"""
         """TimeRange in TimeRange -> bool"""
         if isinstance(other, Time):
-            return other >= self.start and other < self.end
+            return self._start <= other < self._end
         elif isinstance(other, TimeRange):
-            return other.start >= self.start and other.end <= self.end
+            return other._start >= self._start and other._end <= self._end
         else:
             return NotImplemented
 
+    def _key(self) -> Tuple[int, int]:
+        return (self._start, self._end)
+
     def __lt__(self, other: Time):
         """Time < TimeRange -> bool"""
         """TimeRange < TimeRange -> bool"""
         if isinstance(other, Time):
-            return self.end <= other
+            return self._end <= other
         elif isinstance(other, TimeRange):
-            return (self.start, self.end) < (other.start, other.end)
+            return self._key() < other._key()
         else:
             return NotImplemented
 
@@ -105,30 +113,33 @@ class TimeRange:
         """Time <= TimeRange -> bool"""
         """TimeRange <= TimeRange -> bool"""
         if isinstance(other, Time):
-            return self.start <= other
+            return self._start <= other
         elif isinstance(other, TimeRange):
-            return (self.start, self.end) <= (other.start, other.end)
+            return self._key() <= other._key()
         else:
             return NotImplemented
 
     def __eq__(self, other: Time):
         """TimeRange == TimeRange -> bool"""
         if isinstance(other, TimeRange):
-            return (self.start, self.end) == (other.start, other.end)
+            return self._start == other._start and self._end == other._end
         else:
             return NotImplemented
 
     def __ne__(self, other: Time):
         """TimeRange != TimeRange -> bool"""
-        return not self.__eq__(other)
+        if isinstance(other, TimeRange):
+            return self._start != other._start or self._end != other._end
+        else:
+            return NotImplemented
 
     def __gt__(self, other: Time):
         """Time > TimeRange -> bool"""
         """TimeRange > TimeRange -> bool"""
         if isinstance(other, Time):
-            return self.start > other
+            return self._start > other
         elif isinstance(other, TimeRange):
-            return (self.start, self.end) > (other.start, other.end)
+            return self._key() > other._key()
         else:
             return NotImplemented
 
@@ -136,8 +147,8 @@ class TimeRange:
         """Time >= TimeRange -> bool"""
         """TimeRange >= TimeRange -> bool"""
         if isinstance(other, Time):
-            return self.end > other
+            return self._end > other
         elif isinstance(other, TimeRange):
-            return (self.start, self.end) >= (other.start, other.end)
+            return self._key() >= other._key()
         else:
             return NotImplemented
@@ -1,3 +1,7 @@
+import pickle
+import timeit
+from functools import total_ordering
+
 import pytest
 from digical import Time, TimeRange
 
@@ -210,3 +214,63 @@ def test_end():
     """TimeRange.end -> Time"""
     timerange = TimeRange(Time(1000), Time(2000))
     assert timerange.end == Time(2000)
+
+
+def test_immutable():
+    """TimeRange is immutable"""
+    timerange = TimeRange(Time(1000), Time(2000))
+    with pytest.raises(AttributeError):
+        timerange.start = Time(0)
+    with pytest.raises(AttributeError):
+        timerange.extra = 0
+    assert timerange.start == Time(1000)
+
+
+class SubTimeRange(TimeRange):
+    __slots__ = ()
+
+
+def test_pickle():
+    """pickle.loads(pickle.dumps(TimeRange)) -> TimeRange"""
+    timerange = TimeRange(Time(1000), Time(20000))
+    assert pickle.loads(pickle.dumps(timerange)) == timerange
+    subrange = SubTimeRange(Time(1000), Time(20000))
+    assert type(pickle.loads(pickle.dumps(subrange))) is SubTimeRange
+    assert pickle.loads(pickle.dumps(subrange)) == subrange
+
+
+@total_ordering
+class BaselineTime:
+    """Time as it was before it was int-backed"""
+
+    def __init__(self, value):
+        self._value = value
+
+    def __lt__(self, other):
+        if isinstance(other, BaselineTime):
+            return self._value < other._value
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, BaselineTime):
+            return self._value == other._value
+        return NotImplemented
+
+
+class BaselineTimeRange:
+    """TimeRange as it was before it was slotted"""
+
+    def __init__(self, start, end):
+        if start >= end:
+            raise ValueError("Invalid TimeRange: start must be less than end")
+        self._start = start
+        self._end = end
+
+
+def test_construction_speed():
+    """TimeRange(Time, Time) -> TimeRange"""
+    def best(stmt, start, end):
+        return min(timeit.repeat(stmt, globals={**globals(), "start": start, "end": end}, number=20000, repeat=5))
+    current = best("TimeRange(start, end)", Time(1000), Time(2000))
+    baseline = best("BaselineTimeRange(start, end)", BaselineTime(1000), BaselineTime(2000))
+    assert current <= baseline